@@ -2,11 +2,14 @@
 """Convert BOP PDFs and DOCX files to a combined text file."""
 
 import argparse
+import functools
+import os
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a file; installed entry points import normally
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.list_rigs import list_rigs
 from src.ingestion.extract_text import build_combined_file
@@ -35,8 +38,9 @@ def print_manual_instructions(rigs, source_dir, output_file):
     print("="*80 + "\n")
 
 
-def main() -> None:
-    """Main entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Convert BOP PDFs/DOCX into a combined text file.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -59,12 +63,39 @@ Examples:
         default="production-data-bop-real.txt",
         help="Path for combined text output (default: production-data-bop-real.txt).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for parallel per-document extraction (default: CPU count).",
+    )
+    parser.add_argument(
+        "--pdf-backend",
+        choices=["auto", "pymupdf", "pypdfium2", "pypdf2"],
+        default="auto",
+        help="PDF parser: PyMuPDF or pypdfium2 when installed, else PyPDF2 (default: auto).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/extract",
+        help="Cache of extracted text keyed by file content (default: .cache/extract).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract every document instead of reusing cached text.",
+    )
     parser.add_argument(
         "--auto",
         action="store_true",
         help="Automatically extract text instead of manual copy/paste.",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main entry point."""
+    args = _build_parser().parse_args()
 
     # Discover rigs
     rigs = list_rigs(args.source_dir)
@@ -85,7 +116,14 @@ Examples:
     print(f"Output: {args.output_file}\n")
     
     try:
-        build_combined_file(rigs, args.source_dir, args.output_file)
+        build_combined_file(
+            rigs,
+            args.source_dir,
+            args.output_file,
+            max_workers=args.workers,
+            pdf_backend=args.pdf_backend,
+            cache_dir=None if args.no_cache else args.cache_dir,
+        )
         print(f"✓ Successfully wrote combined text to {args.output_file}\n")
         print("⚠️  IMPORTANT: Manually verify the output file!")
         print("   PDF extraction may mis-handle tables and formatting.")
@@ -2,17 +2,20 @@
 """List available rigs in the source documents directory."""
 
 import argparse
+import functools
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a file; installed entry points import normally
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.list_rigs import list_rigs
 
 
-def main() -> None:
-    """Main entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="List all available rigs with BOP documents.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -27,7 +30,12 @@ Examples:
         default="data/source_documents",
         help="Root folder containing one subfolder per rig (default: data/source_documents).",
     )
-    args = parser.parse_args()
+    return parser
+
+
+def main() -> None:
+    """Main entry point."""
+    args = _build_parser().parse_args()
 
     rigs = list_rigs(args.source_dir)
     
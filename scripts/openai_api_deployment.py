@@ -2,43 +2,23 @@
 """Run the complete BOP standardization workflow using OpenAI."""
 
 import argparse
+import functools
+import logging
 import sys
 from pathlib import Path
-from typing import Dict
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a file; installed entry points import normally
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from src.ingestion.documents import load_documents
+from src.config import settings
 from src.workflow.orchestrator import ADNOCWorkflow, WorkflowConfig
 
 
-def load_documents(path: str) -> Dict[str, str]:
-    """Load documents from a combined text file.
-    
-    Args:
-        path: Path to the combined text file.
-        
-    Returns:
-        Dictionary with document name mapped to content.
-    """
-    file_path = Path(path)
-    
-    if not file_path.exists():
-        raise FileNotFoundError(f"Documents file not found: {path}")
-    
-    text = file_path.read_text(encoding="utf-8")
-    
-    # For now, treat entire file as one document
-    # Could be enhanced to split by rig markers
-    docs: Dict[str, str] = {
-        "Combined BOP Documents": text
-    }
-    
-    return docs
-
-
-def main() -> None:
-    """Main entry point."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Run ADNOC BOP standardization workflow with OpenAI.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -63,7 +43,29 @@ Examples:
         default="outputs",
         help="Base directory for outputs (default: outputs).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--mode",
+        choices=["online", "batch"],
+        default=settings.llm_mode,
+        help="online: synchronous API calls; batch: provider Batch API at "
+             "half price, each agent may wait up to 24h "
+             f"(default: {settings.llm_mode}, from LLM_MODE).",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        metavar="DIR",
+        help="Reuse responses for identical agent requests from DIR, e.g. "
+             ".cache/llm while iterating on a run (default: disabled).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Main entry point."""
+    args = _build_parser().parse_args()
+
+    # Workflow progress is logged by src.workflow; show it on stdout as before
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     # Load documents
     print(f"\nLoading documents from: {args.documents_file}")
@@ -79,6 +81,8 @@ Examples:
     config = WorkflowConfig(
         backend="openai",
         output_base_dir=args.output_dir,
+        llm_cache_dir=args.llm_cache,
+        mode=args.mode,
     )
     workflow = ADNOCWorkflow(config)
 
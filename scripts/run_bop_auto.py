@@ -9,19 +9,27 @@ This script automates the entire workflow:
 """
 
 import argparse
+import functools
+import logging
+import os
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a file; installed entry points import normally
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.ingestion.list_rigs import list_rigs
-from src.ingestion.extract_text import build_combined_file
+from src.ingestion.extract_text import iter_rig_texts
+from src.ingestion.documents import build_documents, parse_sections
+from src.agents.base import anthropic_supports_batches
+from src.config import settings
 from src.workflow.orchestrator import ADNOCWorkflow, WorkflowConfig
 
 
-def main() -> None:
-    """Main entry point for automated workflow."""
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser (once per process)."""
     parser = argparse.ArgumentParser(
         description="Automated end-to-end BOP standardization workflow.",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -47,12 +55,67 @@ Examples:
         default="data/source_documents",
         help="Source directory for rig documents (default: data/source_documents).",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for parallel per-document extraction (default: CPU count).",
+    )
+    parser.add_argument(
+        "--pdf-backend",
+        choices=["auto", "pymupdf", "pypdfium2", "pypdf2"],
+        default="auto",
+        help="PDF parser: PyMuPDF or pypdfium2 when installed, else PyPDF2 (default: auto).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=".cache/extract",
+        help="Cache of extracted text keyed by file content (default: .cache/extract).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-extract every document instead of reusing cached text.",
+    )
     parser.add_argument(
         "--output-dir",
         default="outputs",
         help="Base directory for outputs (default: outputs).",
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--mode",
+        choices=["online", "batch"],
+        default=settings.llm_mode,
+        help="online: synchronous API calls; batch: provider Batch API at "
+             "half price, each agent may wait up to 24h "
+             f"(default: {settings.llm_mode}, from LLM_MODE).",
+    )
+    parser.add_argument(
+        "--prompt-cache",
+        action="store_true",
+        help="Mark agent system prompts for Anthropic prompt caching. Cache "
+             "writes cost 1.25x; only worth it when re-running within 5 minutes.",
+    )
+    parser.add_argument(
+        "--llm-cache",
+        metavar="DIR",
+        help="Reuse responses for identical agent requests from DIR, e.g. "
+             ".cache/llm while iterating on a run (default: disabled).",
+    )
+    return parser
+
+
+def main() -> None:
+    """Main entry point for automated workflow."""
+    args = _build_parser().parse_args()
+    if args.mode == "batch" and args.backend == "anthropic" and not anthropic_supports_batches():
+        _build_parser().error(
+            "--mode batch needs an anthropic SDK with the Message Batches API; "
+            "upgrade anthropic or use --mode online"
+        )
+
+    # Workflow progress is logged by src.workflow; show it on stdout as before
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     print("\n" + "="*80)
     print("AUTOMATED BOP STANDARDIZATION WORKFLOW")
@@ -69,10 +132,20 @@ Examples:
 
     # Step 2: Extract text
     print("Step 2: Extracting text from documents...")
-    temp_file = "temp-extracted-text.txt"
     try:
-        build_combined_file(rigs, args.source_dir, temp_file)
-        print(f"✓ Text extracted to {temp_file}\n")
+        # Kept in memory: the text is handed straight to the workflow, so a
+        # temporary combined file would only be written and read back
+        rig_texts = [
+            text
+            for _, text in iter_rig_texts(
+                rigs,
+                args.source_dir,
+                max_workers=args.workers,
+                pdf_backend=args.pdf_backend,
+                cache_dir=None if args.no_cache else args.cache_dir,
+            )
+        ]
+        print(f"✓ Text extracted from {len(rig_texts)} rig(s)\n")
     except Exception as e:
         print(f"\n✗ Extraction failed: {e}\n")
         sys.exit(1)
@@ -80,9 +153,11 @@ Examples:
     # Step 3: Load documents
     print("Step 3: Loading documents...")
     try:
-        text = Path(temp_file).read_text(encoding="utf-8")
-        documents = {"Combined BOP Documents": text}
-        print(f"✓ Loaded {len(text):,} characters\n")
+        documents = build_documents(
+            section for text in rig_texts for section in parse_sections(text)
+        )
+        total_chars = sum(len(text) for text in documents.values())
+        print(f"✓ Loaded {len(documents)} document(s) ({total_chars:,} characters)\n")
     except Exception as e:
         print(f"\n✗ Loading failed: {e}\n")
         sys.exit(1)
@@ -92,6 +167,9 @@ Examples:
     config = WorkflowConfig(
         backend=args.backend,
         output_base_dir=args.output_dir,
+        llm_cache_dir=args.llm_cache,
+        mode=args.mode,
+        prompt_cache=args.prompt_cache,
     )
     workflow = ADNOCWorkflow(config)
 
@@ -101,9 +179,6 @@ Examples:
             documents=documents,
         )
         
-        # Cleanup temp file
-        Path(temp_file).unlink(missing_ok=True)
-        
         print("\n" + "="*80)
         print("WORKFLOW COMPLETED SUCCESSFULLY")
         print("="*80)
@@ -120,9 +195,6 @@ Examples:
         print(f"\n✗ Workflow failed: {e}\n")
         import traceback
         traceback.print_exc()
-        
-        # Cleanup temp file
-        Path(temp_file).unlink(missing_ok=True)
         sys.exit(1)
 
 
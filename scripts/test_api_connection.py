@@ -4,8 +4,9 @@
 import sys
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+# Add src to path when run as a file; installed entry points import normally
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.config import settings
 
@@ -18,8 +19,8 @@ def main() -> None:
     
     # Check API keys
     print("API Keys:")
-    print(f"  OPENAI_API_KEY:    {'\u2713 Set' if settings.openai_api_key else '✗ Not set'}")
-    print(f"  ANTHROPIC_API_KEY: {'\u2713 Set' if settings.anthropic_api_key else '✗ Not set'}")
+    print(f"  OPENAI_API_KEY:    {'✓ Set' if settings.openai_api_key else '✗ Not set'}")
+    print(f"  ANTHROPIC_API_KEY: {'✓ Set' if settings.anthropic_api_key else '✗ Not set'}")
     
     # Check model configuration
     print("\nModel Configuration:")
@@ -1,6 +1,7 @@
 """Multi-agent system for BOP standardization."""
 
 from .base import LLMAgent, AgentResult
+from .cache import LLMCache
 from .comparison_agent import ComparisonAgent
 from .gap_detector_agent import GapDetectorAgent
 from .hp_evaluator_agent import HPEvaluatorAgent
@@ -10,6 +11,7 @@ from .standardisation_writer_agent import StandardisationWriterAgent
 __all__ = [
     "LLMAgent",
     "AgentResult",
+    "LLMCache",
     "ComparisonAgent",
     "GapDetectorAgent",
     "HPEvaluatorAgent",
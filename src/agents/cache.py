@@ -0,0 +1,73 @@
+"""On-disk cache of LLM responses, keyed by the full request."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+
+class LLMCache:
+    """Directory of cached agent responses, one JSON file per request.
+
+    A response is reused only when backend, model, system prompt, user
+    prompt and sampling parameters are all identical. Responses are reused
+    verbatim even at ``temperature > 0``, so enable the cache for
+    development re-runs rather than production analyses. Entries never
+    expire; delete the directory to clear it.
+
+    Attributes:
+        cache_dir: Directory holding the cached responses.
+    """
+
+    def __init__(self, cache_dir: str | os.PathLike):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cached responses (created on first write).
+        """
+        self.cache_dir = Path(cache_dir)
+
+    @staticmethod
+    def key(**request: Any) -> str:
+        """Compute the cache key for a request.
+
+        Args:
+            **request: Everything that determines the response, e.g.
+                ``backend``, ``model``, ``system``, ``prompt``,
+                ``temperature`` and ``max_tokens``.
+
+        Returns:
+            Hex digest of the request.
+        """
+        payload = json.dumps(request, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Tuple[str, Dict[str, Any]] | None:
+        """Return the cached ``(content, meta)`` for ``key``, or None on a miss.
+
+        Unreadable entries (corrupt JSON, or missing fields) count as a
+        miss, so the request is made again and the entry overwritten.
+        """
+        try:
+            entry = json.loads((self.cache_dir / f"{key}.json").read_text(encoding="utf-8"))
+            return entry["content"], entry["meta"]
+        except (FileNotFoundError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, content: str, meta: Dict[str, Any]) -> None:
+        """Store a response under ``key``.
+
+        The entry is written to a temporary file and renamed into place, so
+        agents running in parallel never observe a partial entry.
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp_path.write_text(
+            json.dumps({"content": content, "meta": meta}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.cache_dir / f"{key}.json")
@@ -1,9 +1,9 @@
 """Agent 1: Comparison Analyst."""
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 
-from src.agents.base import LLMAgent, AgentResult
+from src.agents.base import LLMAgent, AgentResult, format_documents, load_prompt, operation_context
+from src.config import settings
 
 
 class ComparisonAgent:
@@ -22,12 +22,8 @@ class ComparisonAgent:
         Args:
             prompt_path: Path to the prompt template file.
         """
-        prompt_file = Path(prompt_path)
-        if prompt_file.exists():
-            system_prompt = prompt_file.read_text(encoding="utf-8")
-        else:
-            # Fallback prompt if file doesn't exist
-            system_prompt = self._get_default_prompt()
+        # Fall back to the built-in prompt if the file doesn't exist
+        system_prompt = load_prompt(prompt_path) or self._get_default_prompt()
         
         self.base_prompt = system_prompt
         self.agent = LLMAgent("Agent 1 – Comparison Analyst", system_prompt)
@@ -74,31 +70,19 @@ Output format (Markdown):
         Returns:
             AgentResult with comparison analysis.
         """
-        # Update system prompt with operation context
-        op_label = operation_name or "the current operation described in the documents"
-        
-        # Get a snippet from the first document for grounding
-        first_doc = next(iter(documents.values()), "") if documents else ""
-        source_snippet = first_doc[:1500]
-        
-        self.agent.system_prompt = (
-            f"{self.base_prompt}\n\n"
-            f"Operation context: {op_label}.\n"
-            "Source document snippet (for grounding):\n"
-            f"{source_snippet}"
-        )
 
-        # Build a comprehensive prompt with all documents
-        docs_summary = "\n\n".join(
-            f"### {name}\n\n{text[:8000]}..." if len(text) > 8000 else f"### {name}\n\n{text}"
-            for name, text in documents.items()
+        # Documents go in the context, fenced off from the instructions as data
+        docs_context = "# Documents\n\n" + format_documents(
+            documents,
+            max_chars=settings.document_max_chars,
+            total_max_chars=settings.document_total_max_chars,
         )
         
         user_prompt = (
+            f"{operation_context(operation_name, documents)}"
             "You are given multiple rig procedures and JSAs for BOP operations.\n"
-            "Perform a comprehensive inventory, structure mapping, and detailed comparison.\n\n"
-            "# Documents\n\n"
-            f"{docs_summary}"
+            "Perform a comprehensive inventory, structure mapping, and detailed comparison "
+            "of the documents provided above."
         )
         
-        return self.agent.run(user_prompt, backend=backend)
+        return self.agent.run(user_prompt, backend=backend, context=docs_context)
@@ -1,9 +1,13 @@
 """Agent 4: Equipment Validator."""
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 
-from src.agents.base import LLMAgent, AgentResult
+from src.agents.base import LLMAgent, AgentResult, format_documents, load_prompt, operation_context, truncate_text
+from src.config import settings
+
+
+# Characters of each source document sent to this agent, at most
+DOCUMENT_MAX_CHARS = 6000
 
 
 class EquipmentValidatorAgent:
@@ -22,11 +26,8 @@ class EquipmentValidatorAgent:
         Args:
             prompt_path: Path to the prompt template file.
         """
-        prompt_file = Path(prompt_path)
-        if prompt_file.exists():
-            system_prompt = prompt_file.read_text(encoding="utf-8")
-        else:
-            system_prompt = self._get_default_prompt()
+        # Fall back to the built-in prompt if the file doesn't exist
+        system_prompt = load_prompt(prompt_path) or self._get_default_prompt()
         
         self.base_prompt = system_prompt
         self.agent = LLMAgent("Agent 4 – Equipment Validator", system_prompt)
@@ -71,35 +72,22 @@ Output format (Markdown):
         Returns:
             AgentResult with equipment validation.
         """
-        # Update system prompt with operation context
-        op_label = operation_name or "the current operation described in the documents"
-        
-        # Get a snippet from the first document for grounding
-        first_doc = next(iter(documents.values()), "") if documents else ""
-        source_snippet = first_doc[:1500]
-        
-        self.agent.system_prompt = (
-            f"{self.base_prompt}\n\n"
-            f"Operation context: {op_label}.\n"
-            "Source document snippet (for grounding):\n"
-            f"{source_snippet}"
-        )
-
-        # Extract equipment-related sections from documents
-        docs_summary = "\n\n".join(
-            f"### {name}\n\n{text[:6000]}..."
-            for name, text in documents.items()
+        # Equipment specs need less of each document than the full comparison
+        docs_context = "# Documents\n\n" + format_documents(
+            documents,
+            max_chars=min(settings.document_max_chars, DOCUMENT_MAX_CHARS),
+            total_max_chars=settings.document_total_max_chars,
         )
         
         agent1_output = previous_outputs.get("agent1", "")
         
         user_prompt = (
-            "You are validating equipment specifications for BOP standardization.\n\n"
-            "# Documents (Equipment Sections)\n\n"
-            f"{docs_summary}\n\n"
+            f"{operation_context(operation_name, documents)}"
+            "You are validating equipment specifications for BOP standardization "
+            "using the documents provided above.\n\n"
             "# Agent 1 Comparison (for context)\n\n"
-            f"{agent1_output[:4000]}...\n\n"
+            f"{truncate_text(agent1_output, 4000)}\n\n"
             "Extract and compare all equipment specifications. Assess standardization feasibility."
         )
         
-        return self.agent.run(user_prompt, backend=backend)
+        return self.agent.run(user_prompt, backend=backend, context=docs_context)
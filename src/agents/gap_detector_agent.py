@@ -1,9 +1,8 @@
 """Agent 2: Gap Detector."""
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 
-from src.agents.base import LLMAgent, AgentResult
+from src.agents.base import LLMAgent, AgentResult, load_prompt, operation_context
 
 
 class GapDetectorAgent:
@@ -22,11 +21,8 @@ class GapDetectorAgent:
         Args:
             prompt_path: Path to the prompt template file.
         """
-        prompt_file = Path(prompt_path)
-        if prompt_file.exists():
-            system_prompt = prompt_file.read_text(encoding="utf-8")
-        else:
-            system_prompt = self._get_default_prompt()
+        # Fall back to the built-in prompt if the file doesn't exist
+        system_prompt = load_prompt(prompt_path) or self._get_default_prompt()
         
         self.base_prompt = system_prompt
         self.agent = LLMAgent("Agent 2 – Gap Detector", system_prompt)
@@ -71,23 +67,10 @@ Output format (Markdown):
         Returns:
             AgentResult with gap analysis.
         """
-        # Update system prompt with operation context
-        op_label = operation_name or "the current operation described in the documents"
-        
-        # Get a snippet from the first document for grounding
-        first_doc = next(iter(documents.values()), "") if documents else ""
-        source_snippet = first_doc[:1500]
-        
-        self.agent.system_prompt = (
-            f"{self.base_prompt}\n\n"
-            f"Operation context: {op_label}.\n"
-            "Source document snippet (for grounding):\n"
-            f"{source_snippet}"
-        )
-
         agent1_output = previous_outputs.get("agent1", "")
         
         user_prompt = (
+            f"{operation_context(operation_name, documents)}"
             "You are analyzing BOP procedures for gaps and misalignments.\n\n"
             "# Agent 1 Comparison Output\n\n"
             f"{agent1_output}\n\n"
@@ -1,9 +1,8 @@
 """Agent 3: Human Performance Evaluator."""
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 
-from src.agents.base import LLMAgent, AgentResult
+from src.agents.base import LLMAgent, AgentResult, load_prompt, operation_context, truncate_text
 
 
 class HPEvaluatorAgent:
@@ -22,11 +21,8 @@ class HPEvaluatorAgent:
         Args:
             prompt_path: Path to the prompt template file.
         """
-        prompt_file = Path(prompt_path)
-        if prompt_file.exists():
-            system_prompt = prompt_file.read_text(encoding="utf-8")
-        else:
-            system_prompt = self._get_default_prompt()
+        # Fall back to the built-in prompt if the file doesn't exist
+        system_prompt = load_prompt(prompt_path) or self._get_default_prompt()
         
         self.base_prompt = system_prompt
         self.agent = LLMAgent("Agent 3 – HP Evaluator", system_prompt)
@@ -71,29 +67,16 @@ Output format (Markdown):
         Returns:
             AgentResult with HP evaluation.
         """
-        # Update system prompt with operation context
-        op_label = operation_name or "the current operation described in the documents"
-        
-        # Get a snippet from the first document for grounding
-        first_doc = next(iter(documents.values()), "") if documents else ""
-        source_snippet = first_doc[:1500]
-        
-        self.agent.system_prompt = (
-            f"{self.base_prompt}\n\n"
-            f"Operation context: {op_label}.\n"
-            "Source document snippet (for grounding):\n"
-            f"{source_snippet}"
-        )
-
         agent1_output = previous_outputs.get("agent1", "")
         agent2_output = previous_outputs.get("agent2", "")
         
         user_prompt = (
+            f"{operation_context(operation_name, documents)}"
             "You are evaluating human performance factors in BOP procedures.\n\n"
             "# Agent 1 Comparison Output\n\n"
-            f"{agent1_output[:6000]}...\n\n"
+            f"{truncate_text(agent1_output, 6000)}\n\n"
             "# Agent 2 Gap Analysis\n\n"
-            f"{agent2_output[:4000]}...\n\n"
+            f"{truncate_text(agent2_output, 4000)}\n\n"
             "Evaluate human performance maturity, critical controls, and error prevention."
         )
         
@@ -1,9 +1,17 @@
 """Agent 5: Standardisation Writer."""
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 
-from src.agents.base import LLMAgent, AgentResult
+from src.agents.base import LLMAgent, AgentResult, load_prompt, operation_context, truncate_text
+
+
+# (previous_outputs key, section heading, character budget) per earlier agent
+PREVIOUS_OUTPUT_SECTIONS = (
+    ("agent1", "Agent 1 – Comparison Analysis", 5000),
+    ("agent2", "Agent 2 – Gap Analysis", 4000),
+    ("agent3", "Agent 3 – HP Evaluation", 4000),
+    ("agent4", "Agent 4 – Equipment Validation", 4000),
+)
 
 
 class StandardisationWriterAgent:
@@ -22,11 +30,8 @@ class StandardisationWriterAgent:
         Args:
             prompt_path: Path to the prompt template file.
         """
-        prompt_file = Path(prompt_path)
-        if prompt_file.exists():
-            system_prompt = prompt_file.read_text(encoding="utf-8")
-        else:
-            system_prompt = self._get_default_prompt()
+        # Fall back to the built-in prompt if the file doesn't exist
+        system_prompt = load_prompt(prompt_path) or self._get_default_prompt()
         
         self.base_prompt = system_prompt
         self.agent = LLMAgent("Agent 5 – Standardisation Writer", system_prompt)
@@ -71,37 +76,31 @@ Output format (Markdown):
             operation_name: Name of the operation.
             
         Returns:
-            AgentResult with standardized procedures.
+            AgentResult with standardized procedures. If every previous
+            output is empty there is nothing to synthesize, so the LLM call
+            is skipped and the result's meta has ``"skipped": True``.
         """
-        # Update system prompt with operation context
-        op_label = operation_name or "the current operation described in the documents"
-        
-        # Get a snippet from the first document for grounding
-        first_doc = next(iter(documents.values()), "") if documents else ""
-        source_snippet = first_doc[:1500]
-        
-        self.agent.system_prompt = (
-            f"{self.base_prompt}\n\n"
-            f"Operation context: {op_label}.\n"
-            "Source document snippet (for grounding):\n"
-            f"{source_snippet}"
-        )
+        if not any(previous_outputs.get(key) for key, _, _ in PREVIOUS_OUTPUT_SECTIONS):
+            return AgentResult(
+                content="[Standardisation skipped: no upstream agent outputs provided]",
+                meta={
+                    "agent": self.agent.name,
+                    "backend": backend,
+                    "skipped": True,
+                    "tokens_total": 0,
+                    "total_duration_seconds": 0.0,
+                },
+            )
 
-        agent1_output = previous_outputs.get("agent1", "")
-        agent2_output = previous_outputs.get("agent2", "")
-        agent3_output = previous_outputs.get("agent3", "")
-        agent4_output = previous_outputs.get("agent4", "")
+        sections = "".join(
+            f"# {heading}\n\n{truncate_text(previous_outputs.get(key, ''), max_chars)}\n\n"
+            for key, heading, max_chars in PREVIOUS_OUTPUT_SECTIONS
+        )
         
         user_prompt = (
+            f"{operation_context(operation_name, documents)}"
             "You are creating the final standardized BOP procedures.\n\n"
-            "# Agent 1 – Comparison Analysis\n\n"
-            f"{agent1_output[:5000]}...\n\n"
-            "# Agent 2 – Gap Analysis\n\n"
-            f"{agent2_output[:4000]}...\n\n"
-            "# Agent 3 – HP Evaluation\n\n"
-            f"{agent3_output[:4000]}...\n\n"
-            "# Agent 4 – Equipment Validation\n\n"
-            f"{agent4_output[:4000]}...\n\n"
+            f"{sections}"
             "Synthesize all findings into a comprehensive standardized ROP and JSA."
         )
         
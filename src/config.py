@@ -17,6 +17,11 @@ class Settings:
     model_name_anthropic: str = os.getenv("MODEL_NAME_ANTHROPIC", "claude-3-5-sonnet-20241022")
     temperature: float = float(os.getenv("TEMPERATURE", "0.2"))
     max_tokens: int = int(os.getenv("MAX_TOKENS", "4096"))
+    llm_mode: str = os.getenv("LLM_MODE", "online")
+    batch_poll_seconds: float = float(os.getenv("BATCH_POLL_SECONDS", "30"))
+    max_retries: int = int(os.getenv("LLM_MAX_RETRIES", "5"))
+    document_max_chars: int = int(os.getenv("DOCUMENT_MAX_CHARS", "8000"))
+    document_total_max_chars: int = int(os.getenv("DOCUMENT_TOTAL_MAX_CHARS", "60000"))
     
     def validate(self) -> None:
         """Validate that required settings are present."""
@@ -4,12 +4,21 @@ from .list_rigs import list_rigs
 from .extract_text import (
     extract_text_from_pdf,
     extract_text_from_docx,
+    extract_rig,
+    iter_rig_texts,
     build_combined_file,
 )
+from .documents import build_documents, iter_sections, load_documents, parse_sections
 
 __all__ = [
     "list_rigs",
     "extract_text_from_pdf",
     "extract_text_from_docx",
+    "extract_rig",
+    "iter_rig_texts",
     "build_combined_file",
+    "iter_sections",
+    "parse_sections",
+    "build_documents",
+    "load_documents",
 ]
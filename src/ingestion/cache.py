@@ -0,0 +1,54 @@
+"""On-disk cache of extracted document text, keyed by file content."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+def document_key(path: Path, backend: str) -> str:
+    """Compute the cache key for a source document.
+
+    Args:
+        path: Path to the PDF/DOCX file.
+        backend: Extraction backend name; different parsers produce
+            different text, so it is part of the key.
+
+    Returns:
+        Hex digest of the file contents, suffix and backend.
+
+    Note:
+        The whole file is hashed (BLAKE2b from the standard library).
+        Hashing only the head and tail would miss edits in the middle of a
+        procedure, and reading the bytes is still far cheaper than parsing.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{backend}:{path.suffix.lower()}:".encode("utf-8"))
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def get_cached_text(cache_dir: str | os.PathLike, key: str) -> str | None:
+    """Return cached text for ``key``, or None on a cache miss."""
+    try:
+        return (Path(cache_dir) / f"{key}.txt").read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
+def put_cached_text(cache_dir: str | os.PathLike, key: str, text: str) -> None:
+    """Store extracted text under ``key``.
+
+    The entry is written to a temporary file and renamed into place, so
+    concurrent extraction workers never observe a partial entry.
+    """
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path / f"{key}.{os.getpid()}.tmp"
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, cache_path / f"{key}.txt")
@@ -0,0 +1,117 @@
+"""Loading of combined text files into workflow documents."""
+
+from __future__ import annotations
+
+import io
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Tuple
+
+RIG_MARKER = "=== RIG: "
+COMBINED_DOCUMENT_NAME = "Combined BOP Documents"
+
+# Read the combined file in 1 MiB blocks rather than the 8 KiB default
+_READ_BUFFER_SIZE = 1 << 20
+
+
+def _parse_header(line: str) -> str | None:
+    """Return the section label for a rig header line, or None."""
+    stripped = line.strip()
+    if not (stripped.startswith(RIG_MARKER) and stripped.endswith("===")):
+        return None
+    return stripped[len(RIG_MARKER):-3].strip() or None
+
+
+def _split_lines(lines: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """Group lines into ``(label, text)`` sections on rig headers."""
+    label = COMBINED_DOCUMENT_NAME
+    buffer: list[str] = []
+
+    for line in lines:
+        # A C-level prefix test rejects body lines without a regex scan
+        header = _parse_header(line) if line.startswith(RIG_MARKER) else None
+        if header is None:
+            buffer.append(line)
+            continue
+
+        text = "".join(buffer).strip()
+        if text:
+            yield label, text
+        label = header
+        buffer = []
+
+    text = "".join(buffer).strip()
+    if text:
+        yield label, text
+
+
+def iter_sections(path: str | os.PathLike) -> Iterator[Tuple[str, str]]:
+    """Stream sections from a combined text file.
+
+    The file is read line by line, so only the section currently being
+    assembled is held in memory rather than the whole corpus.
+
+    Args:
+        path: Path to a combined text file (see ``build_combined_file``).
+
+    Yields:
+        ``(label, text)`` tuples, one per ``=== RIG: <label> ===`` header.
+        Text before the first header (or the whole file, if it has no
+        headers) is yielded under ``COMBINED_DOCUMENT_NAME``. Sections with
+        blank bodies are skipped.
+    """
+    with Path(path).open("r", encoding="utf-8", buffering=_READ_BUFFER_SIZE) as f:
+        yield from _split_lines(f)
+
+
+def parse_sections(text: str) -> Iterator[Tuple[str, str]]:
+    """Split combined-format text that is already in memory.
+
+    Args:
+        text: Text in the combined file format, e.g. the output of
+            ``extract_rig``.
+
+    Yields:
+        ``(label, text)`` tuples, exactly as ``iter_sections`` would for
+        the same content on disk.
+    """
+    # StringIO splits on "\n" only, like file iteration (unlike splitlines)
+    return _split_lines(io.StringIO(text))
+
+
+def build_documents(sections: Iterable[Tuple[str, str]]) -> Dict[str, str]:
+    """Collect ``(label, text)`` sections into a workflow documents dict.
+
+    Args:
+        sections: Sections from ``iter_sections`` or ``parse_sections``.
+
+    Returns:
+        Dictionary mapping each label to its text, in first-seen order.
+        Repeated labels are concatenated.
+    """
+    docs: Dict[str, str] = {}
+    for label, text in sections:
+        docs[label] = f"{docs[label]}\n\n{text}" if label in docs else text
+    return docs
+
+
+def load_documents(path: str | os.PathLike) -> Dict[str, str]:
+    """Load documents from a combined text file.
+
+    Args:
+        path: Path to the combined text file.
+
+    Returns:
+        Dictionary mapping each section label (e.g.
+        ``"DANA – BOP INSTALLATION ROP"``) to its text, in file order.
+        Repeated labels are concatenated.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    file_path = Path(path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"Documents file not found: {path}")
+
+    return build_documents(iter_sections(file_path))
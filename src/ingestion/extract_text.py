@@ -1,20 +1,94 @@
-"""Text extraction from PDF and DOCX files."""
+"""Text extraction from PDF and DOCX files.
+
+The parser packages (PyPDF2, python-docx, PyMuPDF, pypdfium2) are imported on first
+use, so importing ``src.ingestion`` for rig listing or document loading
+does not pay their start-up cost.
+"""
 
 from __future__ import annotations
 
 import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Dict, Iterable, Iterator, Tuple
+
+from .cache import document_key, get_cached_text, put_cached_text
+
+
+PDF_BACKENDS = ("pypdf2", "pymupdf", "pypdfium2", "auto")
+
+
+def _extract_text_pypdf2(path: Path) -> str:
+    """Extract PDF text with the pure-Python PyPDF2 reader."""
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(str(path))
+    parts: list[str] = []
+    
+    for page in reader.pages:
+        text = page.extract_text() or ""
+        parts.append(text)
+    
+    return "\n".join(parts)
+
+
+def _extract_text_pymupdf(path: Path) -> str:
+    """Extract PDF text with PyMuPDF (MuPDF C core, optional dependency)."""
+    import fitz  # type: ignore
+
+    with fitz.open(str(path)) as document:
+        return "\n".join(page.get_text("text") for page in document)
+
+
+def _extract_text_pypdfium2(path: Path) -> str:
+    """Extract PDF text with pypdfium2 (PDFium C++ core, optional dependency)."""
+    import pypdfium2 as pdfium  # type: ignore
+
+    document = pdfium.PdfDocument(str(path))
+    try:
+        parts: list[str] = []
+        for index in range(len(document)):
+            page = document[index]
+            textpage = page.get_textpage()
+            parts.append(textpage.get_text_range())
+            textpage.close()
+            page.close()
+        return "\n".join(parts)
+    finally:
+        document.close()
 
-from PyPDF2 import PdfReader
-import docx  # type: ignore
 
+# Optional backends tried by "auto", fastest first, with their import names
+_AUTO_BACKENDS = (("pymupdf", "fitz"), ("pypdfium2", "pypdfium2"))
 
-def extract_text_from_pdf(path: Path) -> str:
+
+def _resolve_pdf_backend(backend: str) -> str:
+    """Resolve ``auto`` to the first installed optional backend, else PyPDF2."""
+    if backend not in PDF_BACKENDS:
+        raise ValueError(
+            f"Unknown PDF backend: {backend!r} (expected one of {', '.join(PDF_BACKENDS)})"
+        )
+    if backend != "auto":
+        return backend
+    for name, module in _AUTO_BACKENDS:
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        return name
+    return "pypdf2"
+
+
+def extract_text_from_pdf(path: Path, backend: str = "pypdf2") -> str:
     """Extract text content from a PDF file.
     
     Args:
         path: Path to the PDF file.
+        backend: PDF parser to use: "pypdf2", "pymupdf" (requires the optional
+            PyMuPDF package, typically an order of magnitude faster),
+            "pypdfium2" (requires the optional, permissively licensed
+            pypdfium2 package, similarly fast) or "auto" (PyMuPDF, then
+            pypdfium2, when installed, otherwise PyPDF2).
         
     Returns:
         Extracted text content.
@@ -24,14 +98,12 @@ def extract_text_from_pdf(path: Path) -> str:
         especially for complex tables and multi-column layouts.
         Manual verification is recommended for production use.
     """
-    reader = PdfReader(str(path))
-    parts: list[str] = []
-    
-    for page in reader.pages:
-        text = page.extract_text() or ""
-        parts.append(text)
-    
-    return "\n".join(parts)
+    backend = _resolve_pdf_backend(backend)
+    if backend == "pymupdf":
+        return _extract_text_pymupdf(path)
+    if backend == "pypdfium2":
+        return _extract_text_pypdfium2(path)
+    return _extract_text_pypdf2(path)
 
 
 def extract_text_from_docx(path: Path) -> str:
@@ -43,14 +115,198 @@ def extract_text_from_docx(path: Path) -> str:
     Returns:
         Extracted text content.
     """
+    import docx  # type: ignore
+
     document = docx.Document(str(path))
     return "\n".join(p.text for p in document.paragraphs)
 
 
+def _extract_pdf(path: Path, pdf_backend: str) -> str:
+    return extract_text_from_pdf(path, backend=pdf_backend)
+
+
+def _extract_docx(path: Path, pdf_backend: str) -> str:
+    return extract_text_from_docx(path)
+
+
+# Extractor per supported suffix; also the set of files picked up per rig
+_EXTRACTORS: Dict[str, Callable[[Path, str], str]] = {
+    ".pdf": _extract_pdf,
+    ".docx": _extract_docx,
+}
+_DOCUMENT_SUFFIXES = tuple(_EXTRACTORS)  # for str.endswith on entry names
+
+
+def _extract_document(
+    doc_path: Path,
+    pdf_backend: str,
+    cache_dir: str | os.PathLike | None,
+) -> str:
+    """Extract one document, consulting the text cache when enabled."""
+    suffix = doc_path.suffix.lower()
+    key = None
+    if cache_dir is not None:
+        key = document_key(doc_path, pdf_backend if suffix == ".pdf" else "docx")
+        cached = get_cached_text(cache_dir, key)
+        if cached is not None:
+            return cached
+
+    text = _EXTRACTORS[suffix](doc_path, pdf_backend)
+
+    if key is not None:
+        put_cached_text(cache_dir, key, text)
+    return text
+
+
+def _walk_documents(path: str) -> Iterator[Path]:
+    """Yield PDF/DOCX files under ``path`` in directory-scan order.
+
+    Uses ``os.scandir`` so suffixes are checked on the entry name and the
+    file/directory test comes from the cached entry type, instead of one
+    ``stat`` per path for every file in the tree. Folders that cannot be
+    read are skipped, as ``Path.rglob`` does.
+    """
+    subdirs: list[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(_DOCUMENT_SUFFIXES) and entry.is_file():
+                    yield Path(entry.path)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        # e.g. a locked folder on a network share; extract what is readable
+        pass
+    for subdir in subdirs:
+        yield from _walk_documents(subdir)
+
+
+def _rig_documents(rig_dir: Path) -> list[Path]:
+    """Return the rig's PDF/DOCX files in sorted path order."""
+    return sorted(_walk_documents(str(rig_dir)))
+
+
+def _extract_section(
+    rig: str,
+    doc_path: Path,
+    pdf_backend: str,
+    cache_dir: str | os.PathLike | None,
+) -> str:
+    """Return one document's header and text block for the combined file.
+
+    Note:
+        Module-level so it can be dispatched to worker processes.
+    """
+    header = f"=== RIG: {rig} – {doc_path.stem} ===\n\n"
+
+    # Extract text (or reuse it from a previous run)
+    try:
+        text = _extract_document(doc_path, pdf_backend, cache_dir)
+    except Exception as e:
+        return f"{header}[ERROR: Could not extract text from {doc_path}: {e}]\n\n"
+    return f"{header}{text.strip()}\n\n"
+
+
+def extract_rig(
+    rig: str,
+    source_dir: str | os.PathLike,
+    pdf_backend: str = "pypdf2",
+    cache_dir: str | os.PathLike | None = None,
+) -> str:
+    """Extract the combined text block for a single rig.
+
+    Args:
+        rig: Rig name (subdirectory of ``source_dir``).
+        source_dir: Root directory containing rig subdirectories.
+        pdf_backend: PDF parser passed to ``extract_text_from_pdf``.
+        cache_dir: Directory for cached extracted text, keyed by file
+            content. ``None`` (default) disables caching.
+
+    Returns:
+        The rig's section of the combined file: one header and text block
+        per PDF/DOCX document, in sorted path order. Returns an empty string
+        if the rig directory does not exist.
+    """
+    rig_dir = Path(source_dir) / rig
+    if not rig_dir.exists():
+        return ""
+
+    # Resolve once per rig rather than probing imports for every file
+    pdf_backend = _resolve_pdf_backend(pdf_backend)
+
+    return "".join(
+        _extract_section(rig, doc_path, pdf_backend, cache_dir)
+        for doc_path in _rig_documents(rig_dir)
+    )
+
+
+def iter_rig_texts(
+    rigs: Iterable[str],
+    source_dir: str | os.PathLike,
+    max_workers: int | None = 1,
+    pdf_backend: str = "pypdf2",
+    cache_dir: str | os.PathLike | None = None,
+) -> Iterator[Tuple[str, str]]:
+    """Extract rigs and yield each one's text as soon as it is ready.
+
+    Args:
+        rigs: Rig names to process.
+        source_dir: Root directory containing rig subdirectories.
+        max_workers: Number of worker processes used to extract documents
+            in parallel. ``1`` (default) extracts in the current process;
+            ``None`` uses ``os.cpu_count()``.
+        pdf_backend: PDF parser: "pypdf2", "pymupdf", "pypdfium2" or "auto".
+        cache_dir: Directory for cached extracted text; ``None`` disables it.
+
+    Yields:
+        ``(rig, text)`` tuples in the order given by ``rigs``, where ``text``
+        is the rig's section of the combined file (see ``extract_rig``).
+        With several workers, later documents are extracted in the
+        background while earlier rigs are being consumed.
+    """
+    rigs = list(rigs)
+    pdf_backend = _resolve_pdf_backend(pdf_backend)  # fail fast on an unknown backend
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if max_workers <= 1:
+        # Serial path: no process start-up cost
+        for rig in rigs:
+            yield rig, extract_rig(rig, source_dir, pdf_backend, cache_dir)
+        return
+
+    # Dispatch per document rather than per rig, so one rig with many
+    # documents does not leave the other workers idle
+    rig_documents = []
+    for rig in rigs:
+        rig_dir = Path(source_dir) / rig
+        rig_documents.append(_rig_documents(rig_dir) if rig_dir.exists() else [])
+    total = sum(len(docs) for docs in rig_documents)
+    if total <= 1:
+        for rig in rigs:
+            yield rig, extract_rig(rig, source_dir, pdf_backend, cache_dir)
+        return
+
+    # PDF parsing is CPU-bound and not thread-safe, so use processes
+    with ProcessPoolExecutor(max_workers=min(max_workers, total)) as executor:
+        futures = [
+            [
+                executor.submit(_extract_section, rig, doc_path, pdf_backend, cache_dir)
+                for doc_path in docs
+            ]
+            for rig, docs in zip(rigs, rig_documents)
+        ]
+        for rig, rig_futures in zip(rigs, futures):
+            yield rig, "".join(future.result() for future in rig_futures)
+
+
 def build_combined_file(
     rigs: Iterable[str],
     source_dir: str | os.PathLike,
     output_file: str | os.PathLike,
+    max_workers: int | None = 1,
+    pdf_backend: str = "pypdf2",
+    cache_dir: str | os.PathLike | None = None,
 ) -> None:
     """Build a combined text file from all rig documents.
     
@@ -58,6 +314,13 @@ def build_combined_file(
         rigs: List of rig names to process.
         source_dir: Root directory containing rig subdirectories.
         output_file: Path for the combined output file.
+        max_workers: Number of worker processes used to extract documents in
+            parallel. ``1`` (default) extracts in the current process;
+            ``None`` uses ``os.cpu_count()``.
+        pdf_backend: PDF parser: "pypdf2", "pymupdf", "pypdfium2" or "auto".
+        cache_dir: Directory for cached extracted text, keyed by file
+            content, so unchanged documents are not re-parsed on re-runs.
+            ``None`` (default) disables caching.
         
     The output file follows this format:
         === RIG: DANA – BOP INSTALLATION ROP ===
@@ -70,36 +333,12 @@ def build_combined_file(
         
     Note:
         This function will overwrite the output file if it exists.
+        Rig sections are always written in the order given by ``rigs``,
+        regardless of which worker finishes first.
     """
-    root = Path(source_dir)
     out_path = Path(output_file)
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     with out_path.open("w", encoding="utf-8") as out:
-        for rig in rigs:
-            rig_dir = root / rig
-            if not rig_dir.exists():
-                continue
-
-            for doc_path in sorted(rig_dir.rglob("*")):
-                if not doc_path.is_file():
-                    continue
-                    
-                suffix = doc_path.suffix.lower()
-                if suffix not in {".pdf", ".docx"}:
-                    continue
-
-                # Create header for this document
-                header = f"=== RIG: {rig} – {doc_path.stem} ==="
-                out.write(header + "\n\n")
-
-                # Extract and write text
-                try:
-                    if suffix == ".pdf":
-                        text = extract_text_from_pdf(doc_path)
-                    else:
-                        text = extract_text_from_docx(doc_path)
-                    
-                    out.write(text.strip() + "\n\n")
-                except Exception as e:
-                    out.write(f"[ERROR: Could not extract text from {doc_path}: {e}]\n\n")
+        for _, text in iter_rig_texts(rigs, source_dir, max_workers, pdf_backend, cache_dir):
+            out.write(text)
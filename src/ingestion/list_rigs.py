@@ -4,6 +4,31 @@ import os
 from pathlib import Path
 from typing import List
 
+DOCUMENT_SUFFIXES = (".pdf", ".docx", ".doc")
+
+
+def _contains_documents(path: str) -> bool:
+    """Return True as soon as any BOP document is found under ``path``.
+
+    Uses ``os.scandir`` so file/directory checks come from the cached
+    directory entry type instead of one ``stat`` per path, and stops at the
+    first match instead of walking the whole tree. Folders that cannot be
+    read are skipped, as ``Path.rglob`` does.
+    """
+    subdirs: List[str] = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.lower().endswith(DOCUMENT_SUFFIXES):
+                    return True
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError:
+        # e.g. a locked folder on a network share; one should not stop
+        # the whole listing
+        pass
+    return any(_contains_documents(subdir) for subdir in subdirs)
+
 
 def list_rigs(source_dir: str | os.PathLike) -> List[str]:
     """List all rig directories containing BOP documents.
@@ -20,26 +45,15 @@ def list_rigs(source_dir: str | os.PathLike) -> List[str]:
         ['AlJubail', 'AlReem', 'Dana', 'Marawwah']
     """
     root = Path(source_dir)
-    rigs: List[str] = []
-    
     if not root.exists():
-        return rigs
-
-    for entry in root.iterdir():
-        # Skip non-directories and hidden folders
-        if not entry.is_dir():
-            continue
-        if entry.name.startswith("."):
-            continue
-        
-        # Check if directory contains BOP documents
-        has_docs = any(
-            f.suffix.lower() in {".pdf", ".docx", ".doc"}
-            for f in entry.rglob("*")
-            if f.is_file()
+        return []
+
+    with os.scandir(root) as entries:
+        candidates = sorted(
+            (entry.name, entry.path)
+            for entry in entries
+            if entry.is_dir() and not entry.name.startswith(".")
         )
-        
-        if has_docs:
-            rigs.append(entry.name)
 
-    return sorted(rigs)
+    # Candidates are already sorted by name, so rigs come out sorted
+    return [name for name, path in candidates if _contains_documents(path)]
@@ -1,5 +1,5 @@
 """Workflow orchestration for multi-agent BOP standardization."""
 
-from .orchestrator import ADNOCWorkflow, WorkflowConfig
+from .orchestrator import ADNOCWorkflow, WorkflowConfig, run_workflows
 
-__all__ = ["ADNOCWorkflow", "WorkflowConfig"]
+__all__ = ["ADNOCWorkflow", "WorkflowConfig", "run_workflows"]
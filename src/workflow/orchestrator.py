@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import json
+import logging
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional speed-up; fall back to the standard library
+    orjson = None
 
 from src.agents.comparison_agent import ComparisonAgent
 from src.agents.gap_detector_agent import GapDetectorAgent
@@ -14,6 +22,54 @@ from src.agents.hp_evaluator_agent import HPEvaluatorAgent
 from src.agents.equipment_validator_agent import EquipmentValidatorAgent
 from src.agents.standardisation_writer_agent import StandardisationWriterAgent
 from src.agents.base import AgentResult
+from src.agents.cache import LLMCache
+
+logger = logging.getLogger(__name__)
+
+# (agent attribute / output key, result file stem, progress label), in the
+# order results are saved; this order is also a valid topological order
+AGENT_STEPS: Tuple[Tuple[str, str, str], ...] = (
+    ("agent1", "agent1_comparison", "Agent 1: Comparison Analyst"),
+    ("agent2", "agent2_gaps", "Agent 2: Gap Detector"),
+    ("agent3", "agent3_hp_evaluation", "Agent 3: Human Performance Evaluator"),
+    ("agent4", "agent4_equipment_validation", "Agent 4: Equipment Validator"),
+    ("agent5", "agent5_standardisation", "Agent 5: Standardisation Writer"),
+)
+
+# Earlier outputs each agent reads from ``previous_outputs``
+AGENT_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    "agent1": (),
+    "agent2": ("agent1",),
+    "agent3": ("agent1", "agent2"),
+    "agent4": ("agent1",),
+    "agent5": ("agent1", "agent2", "agent3", "agent4"),
+}
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    """Write ``data`` as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+
+
+def _create_run_dir(parent: Path, timestamp: str) -> Path:
+    """Create a new, empty run directory named after ``timestamp``.
+
+    Runs started within the same second get ``-2``, ``-3``, ... suffixes
+    rather than sharing (and overwriting) one directory. ``mkdir`` fails
+    atomically on an existing directory, so no lock is needed.
+    """
+    parent.mkdir(parents=True, exist_ok=True)
+    name, attempt = timestamp, 1
+    while True:
+        try:
+            (parent / name).mkdir()
+            return parent / name
+        except FileExistsError:
+            attempt += 1
+            name = f"{timestamp}-{attempt}"
 
 
 @dataclass
@@ -23,15 +79,30 @@ class WorkflowConfig:
     Attributes:
         backend: LLM backend to use ("openai" or "anthropic").
         output_base_dir: Base directory for outputs (default: "outputs").
+        parallel: Run agents concurrently where their inputs allow
+            (default: True). Set False to run strictly 1 → 5.
+        llm_cache_dir: Directory for cached LLM responses, so re-runs on
+            unchanged inputs skip the API (default: None, disabled).
+        prompt_cache: Mark agent system prompts for Anthropic prompt
+            caching (default: False). Each cache write costs 1.25x the
+            input price, and is only read back when agents re-run within
+            5 minutes, e.g. when running several operations in a row.
+        mode: "online" for synchronous API calls or "batch" for the
+            provider Batch API at half price (default: None, use
+            ``LLM_MODE``).
     """
     backend: str = "openai"
     output_base_dir: str = "outputs"
+    parallel: bool = True
+    llm_cache_dir: Optional[str] = None
+    prompt_cache: bool = False
+    mode: Optional[str] = None
 
 
 class ADNOCWorkflow:
     """Orchestrates the complete multi-agent BOP standardization workflow.
     
-    This class manages the sequential execution of 5 agents:
+    This class manages the execution of 5 agents:
     1. Comparison Analyst
     2. Gap Detector
     3. HP Evaluator
@@ -40,7 +111,12 @@ class ADNOCWorkflow:
     
     Each agent receives:
     - Original documents
-    - Outputs from all previous agents
+    - Outputs of the agents it depends on (``AGENT_DEPENDENCIES``)
+    
+    When ``config.parallel`` is set, every agent starts in a worker thread
+    as soon as its dependencies have finished, so Agent 4 (which only reads
+    Agent 1's comparison) runs alongside Agents 2 and 3. Otherwise agents
+    run strictly 1 → 5. Results are always saved in agent order.
     
     Results are saved to timestamped output directories with:
     - Markdown files for each agent's output
@@ -63,6 +139,15 @@ class ADNOCWorkflow:
         self.agent4 = EquipmentValidatorAgent()
         self.agent5 = StandardisationWriterAgent()
 
+        if config.llm_cache_dir:
+            cache = LLMCache(config.llm_cache_dir)
+            for key, _, _ in AGENT_STEPS:
+                getattr(self, key).agent.cache = cache
+
+        for key, _, _ in AGENT_STEPS:
+            getattr(self, key).agent.prompt_cache = config.prompt_cache
+            getattr(self, key).agent.mode = config.mode
+
     def run_complete_workflow(
         self,
         operation_name: str,
@@ -83,17 +168,18 @@ class ADNOCWorkflow:
             >>> output_dir = workflow.run_complete_workflow("BOP Installation", docs)
             >>> print(f"Results saved to: {output_dir}")
         """
+        start = time.perf_counter()
+
         # Create timestamped output directory
         timestamp = time.strftime("%Y%m%d-%H%M%S")
-        out_dir = Path(self.config.output_base_dir) / operation_name / timestamp
-        out_dir.mkdir(parents=True, exist_ok=True)
+        out_dir = _create_run_dir(Path(self.config.output_base_dir) / operation_name, timestamp)
         
-        print(f"\n{'='*80}")
-        print(f"Starting ADNOC BOP Standardization Workflow")
-        print(f"Operation: {operation_name}")
-        print(f"Backend: {self.config.backend}")
-        print(f"Output: {out_dir}")
-        print(f"{'='*80}\n")
+        logger.info("\n%s", "=" * 80)
+        logger.info("Starting ADNOC BOP Standardization Workflow")
+        logger.info("Operation: %s", operation_name)
+        logger.info("Backend: %s", self.config.backend)
+        logger.info("Output: %s", out_dir)
+        logger.info("%s\n", "=" * 80)
         
         # Initialize summary and previous outputs
         summary: Dict[str, Any] = {
@@ -102,113 +188,149 @@ class ADNOCWorkflow:
             "backend": self.config.backend,
             "agents": [],
             "total_tokens": 0,
+            "total_tokens_cache_read": 0,
+            "total_tokens_from_cache": 0,
             "total_duration_seconds": 0,
         }
-        
-        previous: Dict[str, Any] = {}
 
-        def save_result(name: str, result: AgentResult) -> None:
-            """Save agent result to files and update summary."""
+        def write_result(name: str, result: AgentResult) -> None:
+            """Save agent result to its Markdown and metadata files."""
             # Save Markdown content
             md_path = out_dir / f"{name}.md"
             md_path.write_text(result.content, encoding="utf-8")
             
             # Save metadata as JSON
-            meta_path = out_dir / f"{name}.meta.json"
-            meta_path.write_text(
-                json.dumps(result.meta, indent=2),
-                encoding="utf-8",
-            )
-            
-            # Update summary
+            _write_json(out_dir / f"{name}.meta.json", result.meta)
+
+        def summarise_result(name: str, result: AgentResult) -> None:
+            """Add agent result to the summary and report it."""
             summary["agents"].append({**result.meta, "name": name})
-            summary["total_tokens"] += result.meta.get("tokens_total", 0)
             summary["total_duration_seconds"] += result.meta.get("total_duration_seconds", 0)
+            # Responses from the LLM response cache cost no tokens this run
+            from_cache = result.meta.get("cache") == "hit"
+            tokens = 0 if from_cache else result.meta.get("tokens_total", 0)
+            summary["total_tokens"] += tokens
+            if from_cache:
+                summary["total_tokens_from_cache"] += result.meta.get("tokens_total", 0)
+            else:
+                summary["total_tokens_cache_read"] += result.meta.get("tokens_cache_read", 0)
             
-            print(f"✓ {name} completed")
-            print(f"  Duration: {result.meta.get('total_duration_seconds', 0):.2f}s")
-            print(f"  Tokens: {result.meta.get('tokens_total', 0)}")
-            print()
+            if result.meta.get("skipped"):
+                logger.info("- %s skipped: no input to work from\n", name)
+                return
+            
+            logger.info("✓ %s completed", name)
+            logger.info("  Duration: %.2fs", result.meta.get("total_duration_seconds", 0))
+            if from_cache:
+                logger.info("  Served from response cache (%s tokens originally)", result.meta.get("tokens_total", 0))
+            elif result.meta.get("tokens_cache_read"):
+                logger.info("  Cached prompt tokens: %s", result.meta["tokens_cache_read"])
+            logger.info("  Tokens: %s\n", tokens)
 
-        # ============================================================
-        # Agent 1: Comparison Analyst
-        # ============================================================
-        print("Running Agent 1: Comparison Analyst...")
-        r1 = self.agent1.run(
-            documents,
-            previous,
-            backend=self.config.backend,
-            operation_name=operation_name,
-        )
-        save_result("agent1_comparison", r1)
-        previous["agent1"] = r1.content
+        labels = {key: label for key, _, label in AGENT_STEPS}
+        file_names = {key: name for key, name, _ in AGENT_STEPS}
+        results: Dict[str, AgentResult] = {}
+        pending = [key for key, _, _ in AGENT_STEPS]  # topological order
+        summarised = 0
 
-        # ============================================================
-        # Agent 2: Gap Detector
-        # ============================================================
-        print("Running Agent 2: Gap Detector...")
-        r2 = self.agent2.run(
-            documents,
-            previous,
-            backend=self.config.backend,
-            operation_name=operation_name,
-        )
-        save_result("agent2_gaps", r2)
-        previous["agent2"] = r2.content
+        def prepare(key: str) -> Callable[[], AgentResult]:
+            """Log the start of an agent and bind the outputs it depends on."""
+            logger.info("Running %s...", labels[key])
+            inputs = {dep: results[dep].content for dep in AGENT_DEPENDENCIES[key]}
+            return partial(
+                getattr(self, key).run,
+                documents,
+                inputs,
+                backend=self.config.backend,
+                operation_name=operation_name,
+            )
 
-        # ============================================================
-        # Agent 3: HP Evaluator
-        # ============================================================
-        print("Running Agent 3: Human Performance Evaluator...")
-        r3 = self.agent3.run(
-            documents,
-            previous,
-            backend=self.config.backend,
-            operation_name=operation_name,
-        )
-        save_result("agent3_hp_evaluation", r3)
-        previous["agent3"] = r3.content
+        def record(key: str, result: AgentResult) -> None:
+            """Save a result now, then summarise what is complete in agent order."""
+            nonlocal summarised
+            # Written as soon as the agent finishes, while others still run,
+            # so a later failure does not lose finished outputs
+            write_result(file_names[key], result)
+            results[key] = result
+            while summarised < len(AGENT_STEPS) and AGENT_STEPS[summarised][0] in results:
+                done_key, name, _ = AGENT_STEPS[summarised]
+                summarise_result(name, results[done_key])
+                summarised += 1
 
-        # ============================================================
-        # Agent 4: Equipment Validator
-        # ============================================================
-        print("Running Agent 4: Equipment Validator...")
-        r4 = self.agent4.run(
-            documents,
-            previous,
-            backend=self.config.backend,
-            operation_name=operation_name,
-        )
-        save_result("agent4_equipment_validation", r4)
-        previous["agent4"] = r4.content
+        if not self.config.parallel:
+            for key in pending:
+                record(key, prepare(key)())
+        else:
+            # Start every agent whose inputs are ready; whenever one finishes,
+            # start whatever it unblocked
+            with ThreadPoolExecutor(max_workers=len(AGENT_STEPS)) as pool:
+                running: Dict[Future, str] = {}
+                while pending or running:
+                    ready = [
+                        key for key in pending
+                        if all(dep in results for dep in AGENT_DEPENDENCIES[key])
+                    ]
+                    for key in ready:
+                        pending.remove(key)
+                        running[pool.submit(prepare(key))] = key
+                    if not running:
+                        raise RuntimeError(f"Unsatisfiable agent dependencies: {pending}")
 
-        # ============================================================
-        # Agent 5: Standardisation Writer
-        # ============================================================
-        print("Running Agent 5: Standardisation Writer...")
-        r5 = self.agent5.run(
-            documents,
-            previous,
-            backend=self.config.backend,
-            operation_name=operation_name,
-        )
-        save_result("agent5_standardisation", r5)
-        previous["agent5"] = r5.content
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        record(running.pop(future), future.result())
 
         # ============================================================
         # Save summary
         # ============================================================
-        summary_path = out_dir / "summary.json"
-        summary_path.write_text(
-            json.dumps(summary, indent=2),
-            encoding="utf-8",
-        )
+        summary["wall_duration_seconds"] = round(time.perf_counter() - start, 2)
+        _write_json(out_dir / "summary.json", summary)
         
-        print(f"{'='*80}")
-        print(f"Workflow completed successfully!")
-        print(f"Total tokens used: {summary['total_tokens']:,}")
-        print(f"Total duration: {summary['total_duration_seconds']:.2f}s")
-        print(f"Results saved to: {out_dir}")
-        print(f"{'='*80}\n")
+        logger.info("%s", "=" * 80)
+        logger.info("Workflow completed successfully!")
+        logger.info("Total tokens used: %s", f"{summary['total_tokens']:,}")
+        if summary["total_tokens_from_cache"]:
+            logger.info("Tokens served from response cache: %s", f"{summary['total_tokens_from_cache']:,}")
+        logger.info("Total duration (wall clock): %.2fs", summary["wall_duration_seconds"])
+        logger.info("Agent time (sum over agents): %.2fs", summary["total_duration_seconds"])
+        logger.info("Results saved to: %s", out_dir)
+        logger.info("%s\n", "=" * 80)
 
         return out_dir
+
+
+def run_workflows(
+    config: WorkflowConfig,
+    jobs: Iterable[Tuple[str, Dict[str, str]]],
+    max_concurrency: int = 2,
+) -> List[Path]:
+    """Run several independent workflows concurrently.
+
+    Each job runs on its own ``ADNOCWorkflow`` built from ``config`` and
+    writes its own run directory. Up to ``max_concurrency`` workflows are
+    in flight at once, each running its agents concurrently as usual.
+    Rate-limit errors are retried by the SDK clients (``LLM_MAX_RETRIES``).
+
+    Args:
+        config: Workflow configuration shared by every job.
+        jobs: ``(operation_name, documents)`` pairs, e.g. one per rig or
+            operation.
+        max_concurrency: Maximum number of workflows running at once.
+
+    Returns:
+        Output directories, in the order of ``jobs``.
+
+    Raises:
+        Exception: The exception of the first failed job (in job order),
+            re-raised after the remaining jobs have finished.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return []
+
+    def run_job(job: Tuple[str, Dict[str, str]]) -> Path:
+        operation_name, documents = job
+        return ADNOCWorkflow(config).run_complete_workflow(operation_name, documents)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrency, len(jobs)))) as pool:
+        return list(pool.map(run_job, jobs))
@@ -235,6 +235,7 @@ def mock_openai_response():
     mock_response.usage.prompt_tokens = 100
     mock_response.usage.completion_tokens = 50
     mock_response.usage.total_tokens = 150
+    mock_response.usage.prompt_tokens_details.cached_tokens = 0
     return mock_response
 
 
@@ -249,6 +250,8 @@ def mock_anthropic_response():
     mock_response.usage = MagicMock()
     mock_response.usage.input_tokens = 100
     mock_response.usage.output_tokens = 50
+    mock_response.usage.cache_creation_input_tokens = 0
+    mock_response.usage.cache_read_input_tokens = 0
     return mock_response
 
 
@@ -1,10 +1,24 @@
 """Unit tests for src/agents/base.py module."""
 
+import copy
+import dataclasses
+import pickle
+import sys
 import pytest
 from unittest.mock import MagicMock, patch, PropertyMock
 import time
 
-from src.agents.base import AgentResult, LLMAgent
+from src.agents.base import (
+    AgentResult,
+    LLMAgent,
+    _anthropic_batches,
+    anthropic_supports_batches,
+    format_documents,
+    load_prompt,
+    operation_context,
+    truncate_text,
+)
+from src.agents.cache import LLMCache
 
 
 class TestAgentResult:
@@ -57,6 +71,132 @@ code_block()
         assert "# Header" in result.content
         assert "```python" in result.content
 
+    def test_agent_result_uses_slots(self):
+        """AgentResult should not carry a per-instance __dict__."""
+        result = AgentResult(content="text", meta={})
+
+        assert not hasattr(result, "__dict__")
+        # Python < 3.12 raises TypeError here for frozen slotted dataclasses
+        with pytest.raises((AttributeError, TypeError)):
+            result.extra = "not allowed"
+
+    def test_agent_result_is_frozen(self):
+        """AgentResult fields should not be reassigned."""
+        result = AgentResult(content="text", meta={})
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.content = "changed"
+
+    def test_agent_result_pickles_and_copies(self):
+        """Results should survive pickling (worker processes) and copying."""
+        result = AgentResult(content="text", meta={"tokens_total": 5})
+
+        for clone in (pickle.loads(pickle.dumps(result)), copy.copy(result), copy.deepcopy(result)):
+            assert clone == result
+
+        assert copy.deepcopy(result).meta is not result.meta
+
+    def test_agent_result_is_not_hashable(self):
+        """hash() should fail clearly, since meta is a dict."""
+        with pytest.raises(TypeError, match="AgentResult"):
+            hash(AgentResult(content="text", meta={}))
+
+
+class TestLoadPrompt:
+    """Tests for the load_prompt helper."""
+
+    def test_load_prompt_reads_file_once(self, temp_dir):
+        """A template should be read on first use and cached afterwards."""
+        path = temp_dir / "prompt.md"
+        path.write_text("# Prompt v1", encoding="utf-8")
+
+        assert load_prompt(str(path)) == "# Prompt v1"
+        path.write_text("# Prompt v2", encoding="utf-8")
+        assert load_prompt(str(path)) == "# Prompt v1"
+
+    def test_load_prompt_missing_file(self, temp_dir):
+        """A missing template should return None."""
+        assert load_prompt(str(temp_dir / "missing.md")) is None
+
+
+class TestFormatDocuments:
+    """Tests for the format_documents helper."""
+
+    def test_format_documents_short_texts_unchanged(self):
+        """Texts within the limit should be included without a marker."""
+        result = format_documents({"Dana – ROP": "Steps", "Dana – JSA": "Hazards"}, max_chars=100)
+
+        assert result == "### Dana – ROP\n\nSteps\n\n### Dana – JSA\n\nHazards"
+
+    def test_format_documents_truncates_long_texts(self):
+        """Texts over the limit should be cut and marked."""
+        result = format_documents({"Long": "x" * 20}, max_chars=10)
+
+        assert result == "### Long\n\n" + "x" * 10 + "..."
+
+    def test_format_documents_caps_total_length(self):
+        """Many documents should share one overall budget."""
+        documents = {f"Doc {i}": "x" * 1000 for i in range(50)}
+
+        result = format_documents(documents, max_chars=800, total_max_chars=5000)
+
+        assert result.count("x") == 5000
+        assert result.count("...") == 50
+
+    def test_format_documents_shares_unused_budget(self):
+        """Short documents stay whole; the rest of the budget goes to long ones."""
+        documents = {"Long": "a" * 1000, "Short": "b" * 100}
+
+        result = format_documents(documents, max_chars=1000, total_max_chars=600)
+
+        assert result == "### Long\n\n" + "a" * 500 + "...\n\n### Short\n\n" + "b" * 100
+
+    def test_operation_context_uses_name_and_snippet(self):
+        """Operation context should name the operation and quote the first document."""
+        result = operation_context("Dana BOP test", {"ROP": "x" * 2000, "JSA": "y"})
+
+        assert result.startswith("Operation context: Dana BOP test.\n")
+        assert "x" * 1500 + "\n\n" in result
+        assert "x" * 1501 not in result
+
+    def test_operation_context_without_name_or_documents(self):
+        """A generic label should be used when no operation name is given."""
+        result = operation_context(None, {})
+
+        assert "the current operation described in the documents" in result
+
+    def test_truncate_text_marks_only_cut_text(self):
+        """The "..." marker should appear only when text was shortened."""
+        assert truncate_text("short", 10) == "short"
+        assert truncate_text("x" * 20, 10) == "x" * 10 + "..."
+
+
+class TestClientInitialization:
+    """Tests for lazy API client construction."""
+
+    def test_clients_use_configured_max_retries(self, monkeypatch):
+        """Both SDK clients should be built with settings.max_retries."""
+        import src.agents.base as base
+
+        monkeypatch.setattr(base, "_clients_initialized", False)
+        monkeypatch.setattr(base, "_openai_client", None)
+        monkeypatch.setattr(base, "_anthropic_client", None)
+
+        # Stand-in SDK modules, so the test runs whether or not they are installed
+        mock_openai = MagicMock()
+        mock_anthropic = MagicMock()
+
+        with patch("src.agents.base.settings") as mock_settings, \
+             patch.dict(sys.modules, {"openai": mock_openai, "anthropic": mock_anthropic}):
+            mock_settings.openai_api_key = "sk-test"
+            mock_settings.anthropic_api_key = "sk-ant-test"
+            mock_settings.max_retries = 7
+
+            base._initialize_clients()
+
+        assert mock_openai.OpenAI.call_args[1]["max_retries"] == 7
+        assert mock_anthropic.Anthropic.call_args[1]["max_retries"] == 7
+
 
 class TestLLMAgentInitialization:
     """Tests for LLMAgent initialization."""
@@ -138,6 +278,49 @@ class TestLLMAgentOpenAI:
         assert call_kwargs["messages"][1]["role"] == "user"
         assert call_kwargs["messages"][1]["content"] == "User prompt text"
 
+    def test_call_openai_sends_context_as_prefix(self, mock_openai_response):
+        """Shared context should open the user message and set a prompt cache key."""
+        agent = LLMAgent("Test Agent", "System prompt")
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4o"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent._call_openai("User prompt text", context="# Documents")
+            agent._call_openai("Other prompt", context="# Documents")
+
+        first, second = (c[1] for c in mock_client.chat.completions.create.call_args_list)
+        system, user = first["messages"]
+        assert system == {"role": "system", "content": "System prompt"}
+        assert user["role"] == "user"
+        assert user["content"].startswith("<reference_documents>\n# Documents\n</reference_documents>")
+        assert user["content"].endswith("\n\nUser prompt text")
+        assert first["extra_body"]["prompt_cache_key"] == second["extra_body"]["prompt_cache_key"]
+
+    def test_call_openai_reports_cached_prompt_tokens(self, mock_openai_response):
+        """The cached share of the prompt should be reported separately."""
+        agent = LLMAgent("Test Agent", "System prompt")
+        mock_openai_response.usage.prompt_tokens_details.cached_tokens = 64
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4o"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            _, meta = agent._call_openai("Test prompt")
+
+        assert meta["tokens_prompt"] == 100
+        assert meta["tokens_cache_read"] == 64
+
     def test_call_openai_handles_exception(self):
         """_call_openai should handle API exceptions gracefully."""
         agent = LLMAgent("Test Agent", "System prompt")
@@ -241,10 +424,77 @@ class TestLLMAgentAnthropic:
         assert call_kwargs["model"] == "claude-3-5-sonnet-20241022"
         assert call_kwargs["max_tokens"] == 4096
         assert call_kwargs["temperature"] == 0.2
-        assert call_kwargs["system"] == "System prompt"
+        assert call_kwargs["system"] == [{"type": "text", "text": "System prompt"}]
         assert call_kwargs["messages"][0]["role"] == "user"
         assert call_kwargs["messages"][0]["content"] == "User prompt text"
 
+    def test_call_anthropic_prompt_cache_marks_system_prompt(self, mock_anthropic_response):
+        """With prompt_cache on, the system prompt should carry a cache breakpoint."""
+        agent = LLMAgent("Test Agent", "System prompt", prompt_cache=True)
+
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = mock_anthropic_response
+
+        with patch("src.agents.base._get_anthropic_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_anthropic = "claude-3-5-sonnet-20241022"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent._call_anthropic("User prompt text")
+
+        assert mock_client.messages.create.call_args[1]["system"] == [
+            {"type": "text", "text": "System prompt", "cache_control": {"type": "ephemeral"}}
+        ]
+
+    def test_call_anthropic_sends_context_block(self, mock_anthropic_response):
+        """Context should be an uncached user block after the system prompt."""
+        agent = LLMAgent("Test Agent", "System prompt")
+
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = mock_anthropic_response
+
+        with patch("src.agents.base._get_anthropic_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_anthropic = "claude-3-5-sonnet-20241022"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent._call_anthropic("User prompt text", context="# Documents")
+
+        call_kwargs = mock_client.messages.create.call_args[1]
+        assert call_kwargs["system"] == [
+            {"type": "text", "text": "System prompt"},
+        ]
+        [message] = call_kwargs["messages"]
+        documents_block, prompt_block = message["content"]
+        assert message["role"] == "user"
+        assert "cache_control" not in documents_block
+        assert "<reference_documents>\n# Documents\n</reference_documents>" in documents_block["text"]
+        assert prompt_block == {"type": "text", "text": "User prompt text"}
+
+    def test_call_anthropic_counts_cached_prompt_tokens(self, mock_anthropic_response):
+        """Cache reads and writes should be included in the prompt token count."""
+        agent = LLMAgent("Test Agent", "System prompt")
+        mock_anthropic_response.usage.input_tokens = 20
+        mock_anthropic_response.usage.cache_creation_input_tokens = 0
+        mock_anthropic_response.usage.cache_read_input_tokens = 2000
+
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = mock_anthropic_response
+
+        with patch("src.agents.base._get_anthropic_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_anthropic = "claude-3-5-sonnet-20241022"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            _, meta = agent._call_anthropic("Test prompt")
+
+        assert meta["tokens_prompt"] == 2020
+        assert meta["tokens_total"] == 2070
+        assert meta["tokens_cache_read"] == 2000
+
     def test_call_anthropic_handles_exception(self):
         """_call_anthropic should handle API exceptions gracefully."""
         agent = LLMAgent("Test Agent", "System prompt")
@@ -281,6 +531,8 @@ class TestLLMAgentAnthropic:
         mock_response.usage = MagicMock()
         mock_response.usage.input_tokens = 100
         mock_response.usage.output_tokens = 50
+        mock_response.usage.cache_creation_input_tokens = 0
+        mock_response.usage.cache_read_input_tokens = 0
 
         mock_client = MagicMock()
         mock_client.messages.create.return_value = mock_response
@@ -297,6 +549,147 @@ class TestLLMAgentAnthropic:
         assert "Second block." in content
 
 
+class TestLLMAgentBatchMode:
+    """Tests for LLMAgent provider batch mode."""
+
+    @staticmethod
+    def _batch_settings(mock_settings):
+        mock_settings.llm_mode = "batch"
+        mock_settings.batch_poll_seconds = 0
+        mock_settings.model_name_openai = "gpt-4-turbo-preview"
+        mock_settings.model_name_anthropic = "claude-3-5-sonnet-20241022"
+        mock_settings.max_tokens = 4096
+        mock_settings.temperature = 0.2
+
+    def test_call_openai_batch_success(self):
+        """_call_openai should submit a batch and read its output file."""
+        agent = LLMAgent("Test Agent", "System prompt")
+
+        mock_client = MagicMock()
+        mock_client.batches.create.return_value = MagicMock(id="batch_1")
+        mock_client.batches.retrieve.side_effect = [
+            MagicMock(id="batch_1", status="in_progress"),
+            MagicMock(id="batch_1", status="completed", output_file_id="file_out"),
+        ]
+        mock_client.files.content.return_value.text = (
+            '{"custom_id": "agent-request", "error": null, "response": {"status_code": 200, '
+            '"body": {"choices": [{"message": {"content": "Batched answer"}}], '
+            '"usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}}}}\n'
+        )
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            self._batch_settings(mock_settings)
+
+            content, meta = agent._call_openai("Test prompt")
+
+        assert content == "Batched answer"
+        assert meta["mode"] == "batch"
+        assert meta["batch_id"] == "batch_1"
+        assert meta["tokens_total"] == 15
+        mock_client.chat.completions.create.assert_not_called()
+        assert mock_client.files.create.call_args[1]["purpose"] == "batch"
+        assert mock_client.batches.create.call_args[1]["endpoint"] == "/v1/chat/completions"
+        mock_client.files.content.assert_called_once_with("file_out")
+
+    def test_call_openai_batch_failure(self):
+        """A batch that does not complete should produce an error result."""
+        agent = LLMAgent("Test Agent", "System prompt")
+
+        mock_client = MagicMock()
+        mock_client.batches.create.return_value = MagicMock(id="batch_1")
+        mock_client.batches.retrieve.return_value = MagicMock(id="batch_1", status="expired")
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            self._batch_settings(mock_settings)
+
+            content, meta = agent._call_openai("Test prompt")
+
+        assert "Error calling OpenAI batch API" in content
+        assert "expired" in meta["error"]
+
+    def test_agent_mode_overrides_settings(self, mock_openai_response):
+        """An agent's own mode should win over settings.llm_mode."""
+        agent = LLMAgent("Test Agent", "System prompt", mode="online")
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            self._batch_settings(mock_settings)
+
+            agent._call_openai("Test prompt")
+
+        mock_client.chat.completions.create.assert_called_once()
+        mock_client.batches.create.assert_not_called()
+
+    def test_call_anthropic_batch_success(self, mock_anthropic_response):
+        """_call_anthropic should submit a message batch and read its result."""
+        agent = LLMAgent("Test Agent", "System prompt")
+
+        entry = MagicMock()
+        entry.result.type = "succeeded"
+        entry.result.message = mock_anthropic_response
+
+        mock_client = MagicMock()
+        batches = mock_client.messages.batches
+        batches.create.return_value = MagicMock(id="msgbatch_1")
+        batches.retrieve.return_value = MagicMock(id="msgbatch_1", processing_status="ended")
+        batches.results.return_value = iter([entry])
+
+        with patch("src.agents.base._get_anthropic_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            self._batch_settings(mock_settings)
+
+            content, meta = agent._call_anthropic("User prompt text")
+
+        assert content == "This is a mock Anthropic response for testing."
+        assert meta["batch_id"] == "msgbatch_1"
+        assert meta["tokens_total"] == 150
+        mock_client.messages.create.assert_not_called()
+        params = batches.create.call_args[1]["requests"][0]["params"]
+        assert params["system"][0]["text"] == "System prompt"
+        assert params["messages"][0]["content"] == "User prompt text"
+
+    def test_call_anthropic_batch_without_sdk_support(self):
+        """An SDK without Message Batches should give a clear error, not AttributeError."""
+        agent = LLMAgent("Test Agent", "System prompt")
+        # spec'd without batches, like a client from an SDK that predates them
+        mock_client = MagicMock(spec=["messages", "beta"])
+        mock_client.messages = MagicMock(spec=["create"])
+        mock_client.beta = MagicMock(spec=[])
+
+        with patch("src.agents.base._get_anthropic_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            self._batch_settings(mock_settings)
+
+            content, meta = agent._call_anthropic("User prompt text")
+
+        assert "no Message Batches API" in meta["error"]
+        mock_client.messages.create.assert_not_called()
+
+    def test_anthropic_batches_matches_installed_sdk(self):
+        """The batches lookup should work against a real client of the installed SDK."""
+        anthropic = pytest.importorskip("anthropic")
+        # The SDK's own HTTP client keeps older releases working with newer httpx
+        with anthropic.DefaultHttpxClient() as http_client:
+            client = anthropic.Anthropic(api_key="test-key", http_client=http_client)
+            batches = _anthropic_batches(client)
+
+        assert anthropic_supports_batches() is (batches is not None)
+        if batches is not None:
+            for method in ("create", "retrieve", "results"):
+                assert callable(getattr(batches, method))
+
+    def test_anthropic_supports_batches_without_sdk(self):
+        """Batches are unsupported when the anthropic SDK is not installed."""
+        blocked = dict.fromkeys(("anthropic", "anthropic.resources", "anthropic.resources.beta"))
+        with patch.dict(sys.modules, blocked):
+            assert anthropic_supports_batches() is False
+
+
 class TestLLMAgentRun:
     """Tests for LLMAgent.run() method."""
 
@@ -384,3 +777,74 @@ class TestLLMAgentRun:
 
         mock_openai.assert_called_once()
         mock_anthropic.assert_not_called()
+
+
+class TestLLMAgentResponseCache:
+    """Tests for LLMAgent response caching."""
+
+    def test_run_reuses_cached_response(self, temp_dir, mock_openai_response):
+        """A repeated identical request should not call the API again."""
+        agent = LLMAgent("Test Agent", "System prompt", cache=LLMCache(temp_dir))
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4-turbo-preview"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            first = agent.run("Test prompt")
+            second = agent.run("Test prompt")
+            agent.run("Different prompt")
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert first.meta["cache"] == "miss"
+        assert second.meta["cache"] == "hit"
+        assert second.content == first.content
+        assert second.meta["tokens_total"] == first.meta["tokens_total"]
+
+    def test_run_does_not_cache_errors(self, temp_dir):
+        """Failed calls should be retried rather than served from cache."""
+        agent = LLMAgent("Test Agent", "System prompt", cache=LLMCache(temp_dir))
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.side_effect = Exception("API Error")
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4-turbo-preview"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent.run("Test prompt")
+            result = agent.run("Test prompt")
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert "cache" not in result.meta
+        assert list(temp_dir.iterdir()) == []
+
+    @pytest.mark.parametrize("entry", ['{"content": "trunc', '{"content": "no meta"}', "[]"])
+    def test_run_treats_corrupt_cache_entry_as_miss(self, temp_dir, mock_openai_response, entry):
+        """Unreadable cache files should be recomputed and overwritten."""
+        cache = LLMCache(temp_dir)
+        agent = LLMAgent("Test Agent", "System prompt", cache=cache)
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4-turbo-preview"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent.run("Test prompt")
+            [cache_file] = temp_dir.iterdir()
+            cache_file.write_text(entry, encoding="utf-8")
+            result = agent.run("Test prompt")
+
+        assert mock_client.chat.completions.create.call_count == 2
+        assert result.meta["cache"] == "miss"
+        assert cache.get(cache_file.stem) is not None
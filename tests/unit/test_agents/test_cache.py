@@ -0,0 +1,44 @@
+"""Unit tests for src/agents/cache.py module."""
+
+from src.agents.cache import LLMCache
+
+
+class TestLLMCacheKey:
+    """Tests for LLMCache.key."""
+
+    def test_same_request_same_key(self):
+        """Identical requests should share a key regardless of argument order."""
+        a = LLMCache.key(model="gpt-4o", system="S", prompt="P", temperature=0.2)
+        b = LLMCache.key(temperature=0.2, prompt="P", system="S", model="gpt-4o")
+
+        assert a == b
+
+    def test_any_change_changes_key(self):
+        """Changing any request field should change the key."""
+        base = LLMCache.key(model="gpt-4o", system="S", prompt="P", temperature=0.2)
+
+        assert LLMCache.key(model="gpt-4o", system="S", prompt="P2", temperature=0.2) != base
+        assert LLMCache.key(model="gpt-4o", system="S", prompt="P", temperature=0.0) != base
+        assert LLMCache.key(model="gpt-4o-mini", system="S", prompt="P", temperature=0.2) != base
+
+
+class TestLLMCacheEntries:
+    """Tests for LLMCache.get / LLMCache.put."""
+
+    def test_round_trip(self, temp_dir):
+        """Stored responses should be returned on lookup."""
+        cache = LLMCache(temp_dir / "llm")
+        cache.put("abc", "# Output é", {"model": "gpt-4o", "tokens_total": 150})
+
+        assert cache.get("abc") == ("# Output é", {"model": "gpt-4o", "tokens_total": 150})
+
+    def test_miss_returns_none(self, temp_dir):
+        """Unknown keys (and a missing directory) should be a miss."""
+        assert LLMCache(temp_dir / "missing").get("abc") is None
+
+    def test_put_leaves_no_temp_files(self, temp_dir):
+        """Only the final entry should remain after a write."""
+        cache = LLMCache(temp_dir / "llm")
+        cache.put("abc", "text", {})
+
+        assert [p.name for p in (temp_dir / "llm").iterdir()] == ["abc.json"]
@@ -13,13 +13,10 @@ class TestComparisonAgentInitialization:
 
     def test_agent_initialization_with_default_prompt_path(self):
         """ComparisonAgent should initialize with default prompt path."""
-        with patch("src.agents.comparison_agent.Path") as mock_path:
-            mock_path_instance = MagicMock()
-            mock_path_instance.exists.return_value = False
-            mock_path.return_value = mock_path_instance
-
+        with patch("src.agents.comparison_agent.load_prompt", return_value=None) as mock_load:
             agent = ComparisonAgent()
 
+        mock_load.assert_called_once_with("prompts/AGENT-1-PROMPT-TEMPLATE.md")
         assert agent.agent is not None
         assert agent.agent.name == "Agent 1 – Comparison Analyst"
 
@@ -102,11 +99,38 @@ class TestComparisonAgentRun:
             agent = ComparisonAgent(prompt_path="/nonexistent.md")
             agent.run(sample_documents, {}, backend="openai")
 
-        call_args = mock_client.chat.completions.create.call_args
-        user_message = call_args[1]["messages"][1]["content"]
+        messages = mock_client.chat.completions.create.call_args[1]["messages"]
+        documents_section, instructions = messages[-1]["content"].split("</reference_documents>")
 
+        # Documents open the user message, fenced off from the instructions
+        assert [m["role"] for m in messages] == ["system", "user"]
+        assert documents_section.startswith("<reference_documents>\n")
         for doc_name in sample_documents.keys():
-            assert doc_name in user_message
+            assert doc_name in documents_section
+            assert doc_name not in instructions
+            assert doc_name not in messages[0]["content"]
+
+    def test_run_keeps_system_prompt_static(self, sample_documents, mock_openai_response):
+        """Per-run operation context should go in the user prompt, not the system prompt."""
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings:
+            mock_settings.model_name_openai = "gpt-4o"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+
+            agent = ComparisonAgent(prompt_path="/nonexistent.md")
+            agent.run(sample_documents, {}, backend="openai", operation_name="Op A")
+            agent.run(sample_documents, {}, backend="openai", operation_name="Op B")
+
+        first, second = (c[1]["messages"] for c in mock_client.chat.completions.create.call_args_list)
+        system_prompts = [[m["content"] for m in msgs if m["role"] == "system"] for msgs in (first, second)]
+        assert system_prompts[0] == system_prompts[1]
+        assert agent.agent.system_prompt == agent.base_prompt
+        assert "Operation context: Op A." in first[-1]["content"]
+        assert "Operation context: Op B." in second[-1]["content"]
 
     def test_run_truncates_long_documents(self, mock_openai_response):
         """run() should truncate documents longer than 8000 characters."""
@@ -126,12 +150,34 @@ class TestComparisonAgentRun:
             agent.run(documents, {}, backend="openai")
 
         call_args = mock_client.chat.completions.create.call_args
-        user_message = call_args[1]["messages"][1]["content"]
+        documents_section = call_args[1]["messages"][-1]["content"].split("</reference_documents>")[0]
 
         # Should have truncation indicator
-        assert "..." in user_message
+        assert "..." in documents_section
         # Should not include full 10000 characters
-        assert len(user_message) < 10000
+        assert len(documents_section) < 10000
+
+    def test_run_uses_configured_document_limit(self, mock_openai_response):
+        """run() should send documents whole when the limit allows it."""
+        documents = {"Long Document": "x" * 10000}
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings, \
+             patch("src.agents.comparison_agent.settings") as agent_settings:
+            mock_settings.model_name_openai = "gpt-4o"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+            agent_settings.document_max_chars = 20000
+            agent_settings.document_total_max_chars = 50000
+
+            agent = ComparisonAgent(prompt_path="/nonexistent.md")
+            agent.run(documents, {}, backend="openai")
+
+        user_message = mock_client.chat.completions.create.call_args[1]["messages"][-1]["content"]
+        assert "x" * 10000 + "\n</reference_documents>" in user_message
 
     def test_run_with_empty_documents(self, mock_openai_response):
         """run() should handle empty documents dictionary."""
@@ -13,13 +13,10 @@ class TestEquipmentValidatorAgentInitialization:
 
     def test_agent_initialization_with_default_prompt_path(self):
         """EquipmentValidatorAgent should initialize with default prompt path."""
-        with patch("src.agents.equipment_validator_agent.Path") as mock_path:
-            mock_path_instance = MagicMock()
-            mock_path_instance.exists.return_value = False
-            mock_path.return_value = mock_path_instance
-
+        with patch("src.agents.equipment_validator_agent.load_prompt", return_value=None) as mock_load:
             agent = EquipmentValidatorAgent()
 
+        mock_load.assert_called_once_with("prompts/AGENT-4-EQUIPMENT-VALIDATOR.md")
         assert agent.agent is not None
         assert agent.agent.name == "Agent 4 – Equipment Validator"
 
@@ -100,12 +97,13 @@ class TestEquipmentValidatorAgentRun:
             agent = EquipmentValidatorAgent(prompt_path="/nonexistent.md")
             agent.run(sample_documents, sample_previous_outputs, backend="openai")
 
-        call_args = mock_client.chat.completions.create.call_args
-        user_message = call_args[1]["messages"][1]["content"]
+        messages = mock_client.chat.completions.create.call_args[1]["messages"]
+        user_message = messages[-1]["content"]
+        documents_section = user_message.split("</reference_documents>")[0]
 
-        # Should include documents
+        # Should include documents at the start of the user message
         for doc_name in sample_documents.keys():
-            assert doc_name in user_message
+            assert doc_name in documents_section
 
         # Should include Agent 1 output reference
         assert "Agent 1" in user_message
@@ -128,10 +126,32 @@ class TestEquipmentValidatorAgentRun:
             agent.run(documents, sample_previous_outputs, backend="openai")
 
         call_args = mock_client.chat.completions.create.call_args
-        user_message = call_args[1]["messages"][1]["content"]
+        documents_section = call_args[1]["messages"][-1]["content"].split("</reference_documents>")[0]
 
         # Should have truncation indicators
-        assert "..." in user_message
+        assert "..." in documents_section
+
+    def test_run_caps_documents_below_agent1_budget(self, sample_previous_outputs, mock_openai_response):
+        """Agent 4 should send at most 6000 characters per document, even if the limit is higher."""
+        documents = {"Long Equipment Doc": "x" * 10000}
+
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mock_openai_response
+
+        with patch("src.agents.base._get_openai_client", return_value=mock_client), \
+             patch("src.agents.base.settings") as mock_settings, \
+             patch("src.agents.equipment_validator_agent.settings") as agent_settings:
+            mock_settings.model_name_openai = "gpt-4o"
+            mock_settings.max_tokens = 4096
+            mock_settings.temperature = 0.2
+            agent_settings.document_max_chars = 20000
+            agent_settings.document_total_max_chars = 50000
+
+            agent = EquipmentValidatorAgent(prompt_path="/nonexistent.md")
+            agent.run(documents, sample_previous_outputs, backend="openai")
+
+        user_message = mock_client.chat.completions.create.call_args[1]["messages"][-1]["content"]
+        assert "\n\n" + "x" * 6000 + "...\n</reference_documents>" in user_message
 
     def test_run_handles_missing_agent1_output(self, sample_documents, mock_openai_response):
         """run() should handle missing agent1 output gracefully."""
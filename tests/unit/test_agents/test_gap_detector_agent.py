@@ -13,13 +13,10 @@ class TestGapDetectorAgentInitialization:
 
     def test_agent_initialization_with_default_prompt_path(self):
         """GapDetectorAgent should initialize with default prompt path."""
-        with patch("src.agents.gap_detector_agent.Path") as mock_path:
-            mock_path_instance = MagicMock()
-            mock_path_instance.exists.return_value = False
-            mock_path.return_value = mock_path_instance
-
+        with patch("src.agents.gap_detector_agent.load_prompt", return_value=None) as mock_load:
             agent = GapDetectorAgent()
 
+        mock_load.assert_called_once_with("prompts/AGENT-2-GAP-DETECTOR.md")
         assert agent.agent is not None
         assert agent.agent.name == "Agent 2 – Gap Detector"
 
@@ -13,13 +13,10 @@ class TestHPEvaluatorAgentInitialization:
 
     def test_agent_initialization_with_default_prompt_path(self):
         """HPEvaluatorAgent should initialize with default prompt path."""
-        with patch("src.agents.hp_evaluator_agent.Path") as mock_path:
-            mock_path_instance = MagicMock()
-            mock_path_instance.exists.return_value = False
-            mock_path.return_value = mock_path_instance
-
+        with patch("src.agents.hp_evaluator_agent.load_prompt", return_value=None) as mock_load:
             agent = HPEvaluatorAgent()
 
+        mock_load.assert_called_once_with("prompts/AGENT-3-HP-EVALUATOR.md")
         assert agent.agent is not None
         assert agent.agent.name == "Agent 3 – HP Evaluator"
 
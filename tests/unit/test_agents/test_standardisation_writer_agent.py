@@ -13,13 +13,10 @@ class TestStandardisationWriterAgentInitialization:
 
     def test_agent_initialization_with_default_prompt_path(self):
         """StandardisationWriterAgent should initialize with default prompt path."""
-        with patch("src.agents.standardisation_writer_agent.Path") as mock_path:
-            mock_path_instance = MagicMock()
-            mock_path_instance.exists.return_value = False
-            mock_path.return_value = mock_path_instance
-
+        with patch("src.agents.standardisation_writer_agent.load_prompt", return_value=None) as mock_load:
             agent = StandardisationWriterAgent()
 
+        mock_load.assert_called_once_with("prompts/AGENT-5-STANDARDISATION-WRITER.md")
         assert agent.agent is not None
         assert agent.agent.name == "Agent 5 – Standardisation Writer"
 
@@ -160,6 +157,16 @@ class TestStandardisationWriterAgentRun:
 
         assert isinstance(result, AgentResult)
 
+    def test_run_skips_llm_call_without_previous_outputs(self, sample_documents):
+        """run() should not call the API when there is nothing to synthesize."""
+        with patch("src.agents.base._get_openai_client") as mock_get_client:
+            agent = StandardisationWriterAgent(prompt_path="/nonexistent.md")
+            result = agent.run(sample_documents, {"agent1": "", "agent2": ""}, backend="openai")
+
+        mock_get_client.assert_not_called()
+        assert result.meta["skipped"] is True
+        assert result.meta["tokens_total"] == 0
+
     def test_run_handles_partial_previous_outputs(self, sample_documents, mock_openai_response):
         """run() should handle partial previous outputs."""
         partial_outputs = {
@@ -0,0 +1,46 @@
+"""Unit tests for src/ingestion/cache.py module."""
+
+from src.ingestion.cache import document_key, get_cached_text, put_cached_text
+
+
+class TestDocumentKey:
+    """Tests for the document_key function."""
+
+    def test_same_content_same_key(self, temp_dir):
+        """Files with identical bytes should share a key."""
+        a = temp_dir / "a.pdf"
+        b = temp_dir / "b.pdf"
+        a.write_bytes(b"same bytes")
+        b.write_bytes(b"same bytes")
+
+        assert document_key(a, "pypdf2") == document_key(b, "pypdf2")
+
+    def test_changed_content_changes_key(self, temp_dir):
+        """Editing a file should change its key."""
+        path = temp_dir / "doc.pdf"
+        path.write_bytes(b"version 1")
+        before = document_key(path, "pypdf2")
+        path.write_bytes(b"version 2")
+
+        assert document_key(path, "pypdf2") != before
+
+    def test_backend_is_part_of_key(self, temp_dir):
+        """Different backends should not share cache entries."""
+        path = temp_dir / "doc.pdf"
+        path.write_bytes(b"bytes")
+
+        assert document_key(path, "pypdf2") != document_key(path, "pymupdf")
+
+
+class TestCachedText:
+    """Tests for get_cached_text / put_cached_text."""
+
+    def test_round_trip(self, temp_dir):
+        """Stored text should be returned on lookup."""
+        put_cached_text(temp_dir / "cache", "abc", "Extracted é text")
+
+        assert get_cached_text(temp_dir / "cache", "abc") == "Extracted é text"
+
+    def test_miss_returns_none(self, temp_dir):
+        """Unknown keys should return None."""
+        assert get_cached_text(temp_dir, "missing") is None
@@ -0,0 +1,110 @@
+"""Unit tests for src/ingestion/documents.py module."""
+
+import pytest
+
+from src.ingestion.documents import (
+    COMBINED_DOCUMENT_NAME,
+    build_documents,
+    iter_sections,
+    load_documents,
+    parse_sections,
+)
+
+
+COMBINED_TEXT = """=== RIG: Dana – BOP_Installation_ROP ===
+
+1. Pre-job preparations
+2. BOP handling
+
+=== RIG: Dana – BOP_Installation_JSA ===
+
+Step 1: Pre-job meeting
+
+=== RIG: AlReem – BOP_Installation_ROP ===
+
+1. Preparation phase
+"""
+
+
+class TestIterSections:
+    """Tests for the iter_sections generator."""
+
+    def test_iter_sections_splits_on_rig_headers(self, temp_dir):
+        """Should yield one (label, text) tuple per header."""
+        path = temp_dir / "combined.txt"
+        path.write_text(COMBINED_TEXT, encoding="utf-8")
+
+        sections = list(iter_sections(path))
+
+        assert [label for label, _ in sections] == [
+            "Dana – BOP_Installation_ROP",
+            "Dana – BOP_Installation_JSA",
+            "AlReem – BOP_Installation_ROP",
+        ]
+        assert sections[0][1] == "1. Pre-job preparations\n2. BOP handling"
+
+    def test_iter_sections_without_headers(self, temp_dir):
+        """Should yield the whole file as one combined document."""
+        path = temp_dir / "plain.txt"
+        path.write_text("Pasted procedure text\n", encoding="utf-8")
+
+        assert list(iter_sections(path)) == [(COMBINED_DOCUMENT_NAME, "Pasted procedure text")]
+
+    def test_iter_sections_skips_empty_sections(self, temp_dir):
+        """Should skip headers with no body text."""
+        path = temp_dir / "combined.txt"
+        path.write_text("=== RIG: Empty – ROP ===\n\n=== RIG: Dana – ROP ===\n\nBody\n", encoding="utf-8")
+
+        assert list(iter_sections(path)) == [("Dana – ROP", "Body")]
+
+
+class TestParseSections:
+    """Tests for parse_sections and build_documents."""
+
+    def test_parse_sections_matches_file_parsing(self, temp_dir):
+        """In-memory parsing should match parsing the same file."""
+        path = temp_dir / "combined.txt"
+        path.write_text(COMBINED_TEXT, encoding="utf-8")
+
+        assert list(parse_sections(COMBINED_TEXT)) == list(iter_sections(path))
+
+    def test_build_documents_from_multiple_texts(self):
+        """Should merge sections from several rig texts into one dict."""
+        texts = [
+            "=== RIG: Dana – ROP ===\n\nDana steps\n\n",
+            "=== RIG: AlReem – ROP ===\n\nAlReem steps\n\n",
+        ]
+
+        docs = build_documents(section for text in texts for section in parse_sections(text))
+
+        assert docs == {"Dana – ROP": "Dana steps", "AlReem – ROP": "AlReem steps"}
+
+
+class TestLoadDocuments:
+    """Tests for the load_documents function."""
+
+    def test_load_documents_returns_section_dict(self, temp_dir):
+        """Should map section labels to their text in file order."""
+        path = temp_dir / "combined.txt"
+        path.write_text(COMBINED_TEXT, encoding="utf-8")
+
+        docs = load_documents(path)
+
+        assert list(docs) == [
+            "Dana – BOP_Installation_ROP",
+            "Dana – BOP_Installation_JSA",
+            "AlReem – BOP_Installation_ROP",
+        ]
+        assert docs["AlReem – BOP_Installation_ROP"] == "1. Preparation phase"
+
+    def test_load_documents_merges_repeated_labels(self, temp_dir):
+        """Should concatenate sections that share a label."""
+        path = temp_dir / "combined.txt"
+        path.write_text("=== RIG: Dana – ROP ===\nPart 1\n=== RIG: Dana – ROP ===\nPart 2\n", encoding="utf-8")
+
+        assert load_documents(path) == {"Dana – ROP": "Part 1\n\nPart 2"}
+
+    def test_load_documents_missing_file(self, temp_dir):
+        """Should raise FileNotFoundError for a missing file."""
+        with pytest.raises(FileNotFoundError):
+            load_documents(temp_dir / "missing.txt")
@@ -1,5 +1,9 @@
 """Unit tests for src/ingestion/extract_text.py module."""
 
+import os
+import subprocess
+import sys
+
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch, mock_open
@@ -7,10 +11,29 @@ from unittest.mock import MagicMock, patch, mock_open
 from src.ingestion.extract_text import (
     extract_text_from_pdf,
     extract_text_from_docx,
+    extract_rig,
+    iter_rig_texts,
     build_combined_file,
 )
 
 
+class TestLazyImports:
+    """Tests for deferred parser imports."""
+
+    def test_importing_ingestion_skips_parser_packages(self):
+        """Importing src.ingestion should not load PyPDF2 or python-docx."""
+        code = "import sys, src.ingestion; print(sorted({'PyPDF2', 'docx'} & set(sys.modules)))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[3],
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
 class TestExtractTextFromPdf:
     """Tests for extract_text_from_pdf function."""
 
@@ -22,7 +45,7 @@ class TestExtractTextFromPdf:
         mock_reader = MagicMock()
         mock_reader.pages = [mock_page]
 
-        with patch("src.ingestion.extract_text.PdfReader", return_value=mock_reader):
+        with patch("PyPDF2.PdfReader", return_value=mock_reader):
             result = extract_text_from_pdf(Path("/fake/document.pdf"))
 
         assert result == "This is page 1 content."
@@ -39,7 +62,7 @@ class TestExtractTextFromPdf:
         mock_reader = MagicMock()
         mock_reader.pages = [mock_page1, mock_page2, mock_page3]
 
-        with patch("src.ingestion.extract_text.PdfReader", return_value=mock_reader):
+        with patch("PyPDF2.PdfReader", return_value=mock_reader):
             result = extract_text_from_pdf(Path("/fake/document.pdf"))
 
         assert "Page 1 content." in result
@@ -57,7 +80,7 @@ class TestExtractTextFromPdf:
         mock_reader = MagicMock()
         mock_reader.pages = [mock_page1, mock_page2]
 
-        with patch("src.ingestion.extract_text.PdfReader", return_value=mock_reader):
+        with patch("PyPDF2.PdfReader", return_value=mock_reader):
             result = extract_text_from_pdf(Path("/fake/document.pdf"))
 
         assert "Content" in result
@@ -67,12 +90,84 @@ class TestExtractTextFromPdf:
         mock_reader = MagicMock()
         mock_reader.pages = []
 
-        with patch("src.ingestion.extract_text.PdfReader", return_value=mock_reader):
+        with patch("PyPDF2.PdfReader", return_value=mock_reader):
             result = extract_text_from_pdf(Path("/fake/empty.pdf"))
 
         assert result == ""
 
 
+class TestPdfBackends:
+    """Tests for PDF backend selection."""
+
+    def test_pymupdf_backend_uses_fitz(self):
+        """Should extract text via PyMuPDF when requested."""
+        mock_page1 = MagicMock()
+        mock_page1.get_text.return_value = "Page 1"
+        mock_page2 = MagicMock()
+        mock_page2.get_text.return_value = "Page 2"
+        mock_document = MagicMock()
+        mock_document.__enter__.return_value = [mock_page1, mock_page2]
+        mock_fitz = MagicMock()
+        mock_fitz.open.return_value = mock_document
+
+        with patch.dict("sys.modules", {"fitz": mock_fitz}):
+            result = extract_text_from_pdf(Path("/fake/document.pdf"), backend="pymupdf")
+
+        assert result == "Page 1\nPage 2"
+        mock_fitz.open.assert_called_once_with("/fake/document.pdf")
+
+    def test_auto_backend_falls_back_to_pypdf2(self):
+        """Should use PyPDF2 when PyMuPDF is not installed."""
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = "PyPDF2 text"
+        mock_reader = MagicMock()
+        mock_reader.pages = [mock_page]
+
+        with patch.dict("sys.modules", {"fitz": None, "pypdfium2": None}), \
+             patch("PyPDF2.PdfReader", return_value=mock_reader):
+            result = extract_text_from_pdf(Path("/fake/document.pdf"), backend="auto")
+
+        assert result == "PyPDF2 text"
+
+    def test_pypdfium2_backend_reads_every_page(self):
+        """Should extract text via pypdfium2 and close the document."""
+        pages = []
+        for text in ("Page 1", "Page 2"):
+            page = MagicMock()
+            page.get_textpage.return_value.get_text_range.return_value = text
+            pages.append(page)
+        mock_document = MagicMock()
+        mock_document.__len__.return_value = 2
+        mock_document.__getitem__.side_effect = pages.__getitem__
+        mock_pdfium = MagicMock()
+        mock_pdfium.PdfDocument.return_value = mock_document
+
+        with patch.dict("sys.modules", {"pypdfium2": mock_pdfium}):
+            result = extract_text_from_pdf(Path("/fake/document.pdf"), backend="pypdfium2")
+
+        assert result == "Page 1\nPage 2"
+        mock_document.close.assert_called_once()
+
+    def test_auto_backend_prefers_pypdfium2_over_pypdf2(self):
+        """Should use pypdfium2 when it is installed but PyMuPDF is not."""
+        mock_document = MagicMock()
+        mock_document.__len__.return_value = 0
+        mock_pdfium = MagicMock()
+        mock_pdfium.PdfDocument.return_value = mock_document
+
+        with patch.dict("sys.modules", {"fitz": None, "pypdfium2": mock_pdfium}), \
+             patch("PyPDF2.PdfReader") as mock_reader:
+            extract_text_from_pdf(Path("/fake/document.pdf"), backend="auto")
+
+        mock_pdfium.PdfDocument.assert_called_once_with("/fake/document.pdf")
+        mock_reader.assert_not_called()
+
+    def test_unknown_backend_raises(self):
+        """Should reject unknown backend names."""
+        with pytest.raises(ValueError, match="Unknown PDF backend"):
+            extract_text_from_pdf(Path("/fake/document.pdf"), backend="pdfminer")
+
+
 class TestExtractTextFromDocx:
     """Tests for extract_text_from_docx function."""
 
@@ -86,7 +181,7 @@ class TestExtractTextFromDocx:
         mock_doc = MagicMock()
         mock_doc.paragraphs = [mock_para1, mock_para2]
 
-        with patch("src.ingestion.extract_text.docx.Document", return_value=mock_doc):
+        with patch("docx.Document", return_value=mock_doc):
             result = extract_text_from_docx(Path("/fake/document.docx"))
 
         assert result == "First paragraph.\nSecond paragraph."
@@ -101,7 +196,7 @@ class TestExtractTextFromDocx:
         mock_doc = MagicMock()
         mock_doc.paragraphs = [mock_para1, mock_para2]
 
-        with patch("src.ingestion.extract_text.docx.Document", return_value=mock_doc):
+        with patch("docx.Document", return_value=mock_doc):
             result = extract_text_from_docx(Path("/fake/document.docx"))
 
         assert "Content" in result
@@ -111,7 +206,7 @@ class TestExtractTextFromDocx:
         mock_doc = MagicMock()
         mock_doc.paragraphs = []
 
-        with patch("src.ingestion.extract_text.docx.Document", return_value=mock_doc):
+        with patch("docx.Document", return_value=mock_doc):
             result = extract_text_from_docx(Path("/fake/empty.docx"))
 
         assert result == ""
@@ -132,7 +227,7 @@ class TestBuildCombinedFile:
         output_file = temp_dir / "output" / "combined.txt"
 
         # Mock PDF extraction
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "PDF content for TestRig"
             mock_reader = MagicMock()
@@ -158,7 +253,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "Content"
             mock_reader = MagicMock()
@@ -184,7 +279,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "Content"
             mock_reader = MagicMock()
@@ -208,7 +303,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "Content"
             mock_reader = MagicMock()
@@ -233,8 +328,8 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf, \
-             patch("src.ingestion.extract_text.docx.Document") as mock_docx:
+        with patch("PyPDF2.PdfReader") as mock_pdf, \
+             patch("docx.Document") as mock_docx:
             # Mock PDF
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "PDF content"
@@ -267,7 +362,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "PDF content"
             mock_reader = MagicMock()
@@ -291,7 +386,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_pdf.side_effect = Exception("Corrupted PDF")
 
             build_combined_file(["ErrorRig"], source_dir, output_file)
@@ -312,7 +407,7 @@ class TestBuildCombinedFile:
         # Deep nested output path
         output_file = temp_dir / "deep" / "nested" / "path" / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             mock_page.extract_text.return_value = "Content"
             mock_reader = MagicMock()
@@ -334,7 +429,7 @@ class TestBuildCombinedFile:
 
         output_file = temp_dir / "combined.txt"
 
-        with patch("src.ingestion.extract_text.PdfReader") as mock_pdf:
+        with patch("PyPDF2.PdfReader") as mock_pdf:
             mock_page = MagicMock()
             # Include Unicode characters
             mock_page.extract_text.return_value = "Content with unicode: \u00e9\u00e8\u00ea"
@@ -359,3 +454,167 @@ class TestBuildCombinedFile:
         assert output_file.exists()
         content = output_file.read_text(encoding="utf-8")
         assert content == ""
+
+
+class TestExtractRig:
+    """Tests for extract_rig function."""
+
+    def test_extract_rig_returns_rig_section(self, temp_dir):
+        """Should return headers and text for every document in the rig."""
+        rig_dir = temp_dir / "Dana"
+        rig_dir.mkdir()
+        (rig_dir / "ROP.pdf").touch()
+
+        with patch("PyPDF2.PdfReader") as mock_pdf:
+            mock_page = MagicMock()
+            mock_page.extract_text.return_value = "Dana content"
+            mock_reader = MagicMock()
+            mock_reader.pages = [mock_page]
+            mock_pdf.return_value = mock_reader
+
+            result = extract_rig("Dana", temp_dir)
+
+        assert result == "=== RIG: Dana – ROP ===\n\nDana content\n\n"
+
+    def test_extract_rig_includes_nested_documents_in_path_order(self, temp_dir):
+        """Should pick up documents in subfolders, sorted by full path."""
+        rig_dir = temp_dir / "Dana"
+        (rig_dir / "archive").mkdir(parents=True)
+        (rig_dir / "archive" / "Old.PDF").touch()
+        (rig_dir / "ROP.pdf").touch()
+        (rig_dir / "Thumbs.db").touch()
+
+        with patch("PyPDF2.PdfReader") as mock_pdf:
+            mock_page = MagicMock()
+            mock_page.extract_text.return_value = "content"
+            mock_pdf.return_value.pages = [mock_page]
+
+            result = extract_rig("Dana", temp_dir)
+
+        assert result == (
+            "=== RIG: Dana – ROP ===\n\ncontent\n\n"
+            "=== RIG: Dana – Old ===\n\ncontent\n\n"
+        )
+
+    def test_extract_rig_skips_unreadable_folders(self, temp_dir):
+        """An unreadable subfolder should be skipped, not abort extraction."""
+        rig_dir = temp_dir / "Dana"
+        locked = rig_dir / "locked"
+        locked.mkdir(parents=True)
+        (locked / "Hidden.pdf").touch()
+        (rig_dir / "ROP.pdf").touch()
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if str(path) == str(locked):
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("src.ingestion.extract_text.os.scandir", side_effect=scandir), \
+             patch("PyPDF2.PdfReader") as mock_pdf:
+            mock_page = MagicMock()
+            mock_page.extract_text.return_value = "content"
+            mock_pdf.return_value.pages = [mock_page]
+
+            result = extract_rig("Dana", temp_dir)
+
+        assert result == "=== RIG: Dana – ROP ===\n\ncontent\n\n"
+
+    def test_extract_rig_nonexistent_rig(self, temp_dir):
+        """Should return an empty string for a missing rig directory."""
+        assert extract_rig("Missing", temp_dir) == ""
+
+    def test_extract_rig_reuses_cached_text(self, temp_dir):
+        """Should not re-parse an unchanged document when caching is enabled."""
+        rig_dir = temp_dir / "Dana"
+        rig_dir.mkdir()
+        (rig_dir / "ROP.pdf").write_bytes(b"%PDF-1.4 fake")
+        cache_dir = temp_dir / "cache"
+
+        with patch("PyPDF2.PdfReader") as mock_pdf:
+            mock_page = MagicMock()
+            mock_page.extract_text.return_value = "Dana content"
+            mock_pdf.return_value.pages = [mock_page]
+
+            first = extract_rig("Dana", temp_dir, cache_dir=cache_dir)
+            second = extract_rig("Dana", temp_dir, cache_dir=cache_dir)
+
+        assert first == second
+        assert mock_pdf.call_count == 1
+
+
+class TestBuildCombinedFileParallel:
+    """Tests for build_combined_file with multiple workers."""
+
+    def test_parallel_output_preserves_rig_order(self, temp_dir):
+        """Should write rig sections in input order when using workers."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        source_dir = temp_dir / "source"
+        source_dir.mkdir()
+        for rig_name in ["Zulu", "Alpha", "Mike"]:
+            rig_dir = source_dir / rig_name
+            rig_dir.mkdir()
+            (rig_dir / "document.pdf").touch()
+
+        output_file = temp_dir / "combined.txt"
+
+        def fake_extract(doc_path, pdf_backend, cache_dir):
+            return f"{doc_path.parent.name} text"
+
+        # Threads stand in for processes so the patched extractor is visible
+        with patch("src.ingestion.extract_text.ProcessPoolExecutor", ThreadPoolExecutor), \
+             patch("src.ingestion.extract_text._extract_document", side_effect=fake_extract) as mock_extract:
+            build_combined_file(["Zulu", "Alpha", "Mike"], source_dir, output_file, max_workers=3)
+
+        assert mock_extract.call_count == 3
+        content = output_file.read_text(encoding="utf-8")
+        assert content.index("Zulu") < content.index("Alpha") < content.index("Mike")
+
+    def test_parallel_dispatches_per_document(self, temp_dir):
+        """A single rig's documents should be spread across workers."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        rig_dir = temp_dir / "Dana"
+        rig_dir.mkdir()
+        for name in ["C_ROP.pdf", "A_JSA.docx", "B_Annex.pdf"]:
+            (rig_dir / name).touch()
+
+        def fake_extract(doc_path, pdf_backend, cache_dir):
+            return f"{doc_path.stem} text"
+
+        with patch("src.ingestion.extract_text.ProcessPoolExecutor", wraps=ThreadPoolExecutor) as mock_pool, \
+             patch("src.ingestion.extract_text._extract_document", side_effect=fake_extract):
+            parallel = dict(iter_rig_texts(["Dana"], temp_dir, max_workers=4))
+            serial = dict(iter_rig_texts(["Dana"], temp_dir, max_workers=1))
+
+        assert mock_pool.call_args[1]["max_workers"] == 3
+        assert parallel == serial
+        assert parallel["Dana"] == (
+            "=== RIG: Dana – A_JSA ===\n\nA_JSA text\n\n"
+            "=== RIG: Dana – B_Annex ===\n\nB_Annex text\n\n"
+            "=== RIG: Dana – C_ROP ===\n\nC_ROP text\n\n"
+        )
+
+
+class TestIterRigTexts:
+    """Tests for iter_rig_texts generator."""
+
+    def test_iter_rig_texts_yields_rig_and_text(self, temp_dir):
+        """Should yield (rig, text) pairs in input order."""
+        def fake_extract(rig, source_dir, pdf_backend, cache_dir=None):
+            return f"{rig} text"
+
+        with patch("src.ingestion.extract_text.extract_rig", side_effect=fake_extract):
+            result = list(iter_rig_texts(["Dana", "AlReem"], temp_dir))
+
+        assert result == [("Dana", "Dana text"), ("AlReem", "AlReem text")]
+
+    def test_iter_rig_texts_is_lazy(self, temp_dir):
+        """Should not extract a rig until the consumer asks for it."""
+        with patch("src.ingestion.extract_text.extract_rig", return_value="text") as mock_extract:
+            texts = iter_rig_texts(["Dana", "AlReem"], temp_dir)
+            next(texts)
+
+        assert mock_extract.call_count == 1
@@ -1,7 +1,9 @@
 """Unit tests for src/ingestion/list_rigs.py module."""
 
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.ingestion.list_rigs import list_rigs
 
@@ -206,6 +208,46 @@ class TestListRigs:
 
         assert "CaseRig" in result
 
+    def test_list_rigs_stops_at_first_document(self, temp_dir):
+        """list_rigs should not descend into subfolders once a document is found."""
+        source_dir = temp_dir / "source"
+        source_dir.mkdir()
+
+        rig_dir = source_dir / "Dana"
+        rig_dir.mkdir()
+        (rig_dir / "document.pdf").touch()
+        (rig_dir / "archive").mkdir()
+
+        with patch("src.ingestion.list_rigs.os.scandir", wraps=os.scandir) as mock_scandir:
+            result = list_rigs(source_dir)
+
+        assert result == ["Dana"]
+        scanned = [str(c.args[0]) for c in mock_scandir.call_args_list]
+        assert str(rig_dir / "archive") not in scanned
+
+    def test_list_rigs_skips_unreadable_folders(self, temp_dir):
+        """An unreadable subfolder should be skipped, not abort the listing."""
+        source_dir = temp_dir / "source"
+        source_dir.mkdir()
+        locked = source_dir / "Dana" / "locked"
+        locked.mkdir(parents=True)
+        (locked / "document.pdf").touch()
+        (source_dir / "AlReem").mkdir()
+        (source_dir / "AlReem" / "document.pdf").touch()
+        (source_dir / "Locked").mkdir()
+
+        real_scandir = os.scandir
+
+        def scandir(path):
+            if str(path) in {str(locked), str(source_dir / "Locked")}:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        with patch("src.ingestion.list_rigs.os.scandir", side_effect=scandir):
+            result = list_rigs(source_dir)
+
+        assert result == ["AlReem"]
+
     def test_list_rigs_multiple_rigs(self, temp_dir):
         """list_rigs should correctly find multiple rigs."""
         source_dir = temp_dir / "source"
@@ -6,7 +6,15 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch, call
 import time
 
-from src.workflow.orchestrator import WorkflowConfig, ADNOCWorkflow
+from src.workflow.orchestrator import (
+    AGENT_DEPENDENCIES,
+    AGENT_STEPS,
+    ADNOCWorkflow,
+    WorkflowConfig,
+    _create_run_dir,
+    _write_json,
+    run_workflows,
+)
 from src.agents.base import AgentResult
 
 
@@ -19,6 +27,10 @@ class TestWorkflowConfig:
 
         assert config.backend == "openai"
         assert config.output_base_dir == "outputs"
+        assert config.parallel is True
+        assert config.llm_cache_dir is None
+        assert config.prompt_cache is False
+        assert config.mode is None
 
     def test_workflow_config_custom_backend(self):
         """WorkflowConfig should accept custom backend."""
@@ -43,6 +55,50 @@ class TestWorkflowConfig:
         assert config.output_base_dir == "/my/outputs"
 
 
+class TestWriteJson:
+    """Tests for the _write_json helper."""
+
+    def test_write_json_round_trip(self, temp_dir):
+        """Written files should parse back to the same data."""
+        data = {"agent": "Agent 1 – Comparison Analyst", "tokens_total": 150}
+        path = temp_dir / "meta.json"
+
+        _write_json(path, data)
+
+        assert json.loads(path.read_text(encoding="utf-8")) == data
+
+    def test_write_json_without_orjson(self, temp_dir):
+        """Should fall back to the standard json module."""
+        data = {"total_tokens": 750, "agents": []}
+        path = temp_dir / "summary.json"
+
+        with patch("src.workflow.orchestrator.orjson", None):
+            _write_json(path, data)
+
+        assert path.read_text(encoding="utf-8") == json.dumps(data, indent=2)
+
+
+class TestCreateRunDir:
+    """Tests for the _create_run_dir helper."""
+
+    def test_create_run_dir_uses_timestamp(self, temp_dir):
+        """Should create parent/timestamp."""
+        run_dir = _create_run_dir(temp_dir / "BOP Installation", "20240101-120000")
+
+        assert run_dir == temp_dir / "BOP Installation" / "20240101-120000"
+        assert run_dir.is_dir()
+
+    def test_create_run_dir_avoids_collisions(self, temp_dir):
+        """Runs in the same second should get distinct directories."""
+        dirs = [_create_run_dir(temp_dir, "20240101-120000") for _ in range(3)]
+
+        assert [d.name for d in dirs] == [
+            "20240101-120000",
+            "20240101-120000-2",
+            "20240101-120000-3",
+        ]
+
+
 class TestADNOCWorkflowInitialization:
     """Tests for ADNOCWorkflow initialization."""
 
@@ -77,6 +133,37 @@ class TestADNOCWorkflowInitialization:
         mock_agent5.assert_called_once()
 
 
+    def test_workflow_shares_llm_cache(self, temp_dir):
+        """llm_cache_dir should give every agent the same response cache."""
+        workflow = ADNOCWorkflow(WorkflowConfig(llm_cache_dir=str(temp_dir / "llm")))
+
+        caches = {id(getattr(workflow, f"agent{i}").agent.cache) for i in range(1, 6)}
+        assert len(caches) == 1
+        assert workflow.agent1.agent.cache.cache_dir == temp_dir / "llm"
+
+    def test_workflow_passes_prompt_cache_to_agents(self):
+        """prompt_cache should be set on every agent, and be off by default."""
+        assert ADNOCWorkflow(WorkflowConfig()).agent1.agent.prompt_cache is False
+
+        workflow = ADNOCWorkflow(WorkflowConfig(prompt_cache=True))
+
+        assert all(getattr(workflow, f"agent{i}").agent.prompt_cache for i in range(1, 6))
+
+    def test_workflow_passes_mode_to_agents(self):
+        """mode should be set per workflow, on its own agents only."""
+        batch = ADNOCWorkflow(WorkflowConfig(mode="batch"))
+        online = ADNOCWorkflow(WorkflowConfig(mode="online"))
+
+        assert {getattr(batch, f"agent{i}").agent.mode for i in range(1, 6)} == {"batch"}
+        assert {getattr(online, f"agent{i}").agent.mode for i in range(1, 6)} == {"online"}
+
+    def test_workflow_without_llm_cache(self):
+        """Caching should be disabled by default."""
+        workflow = ADNOCWorkflow(WorkflowConfig())
+
+        assert workflow.agent1.agent.cache is None
+
+
 class TestADNOCWorkflowRunCompleteWorkflow:
     """Tests for ADNOCWorkflow.run_complete_workflow method."""
 
@@ -247,6 +334,21 @@ class TestADNOCWorkflowRunCompleteWorkflow:
         # Each agent returns 150 tokens, 5 agents = 750 total
         assert summary["total_tokens"] == 750
 
+    def test_run_complete_workflow_excludes_cache_hits_from_tokens(self, mock_workflow, temp_dir, sample_documents):
+        """Responses served from the LLM cache should not count as tokens used."""
+        mock_workflow.config.output_base_dir = str(temp_dir)
+        hit = AgentResult(content="cached", meta={"tokens_total": 150, "tokens_cache_read": 40, "cache": "hit"})
+        mock_workflow.agent1.run.return_value = hit
+        mock_workflow.agent2.run.return_value = hit
+
+        with patch("builtins.print"):
+            output_dir = mock_workflow.run_complete_workflow("BOP Installation", sample_documents)
+
+        summary = json.loads((output_dir / "summary.json").read_text())
+        assert summary["total_tokens"] == 450
+        assert summary["total_tokens_from_cache"] == 300
+        assert summary["total_tokens_cache_read"] == 0
+
     def test_run_complete_workflow_returns_output_path(self, mock_workflow, temp_dir, sample_documents):
         """run_complete_workflow should return the output directory path."""
         mock_workflow.config.output_base_dir = str(temp_dir)
@@ -298,6 +400,30 @@ class TestADNOCWorkflowRunCompleteWorkflow:
             assert "agent3" in previous
             assert "agent4" in previous
 
+    def test_run_complete_workflow_logs_progress(self, mock_workflow, temp_dir, sample_documents, caplog):
+        """run_complete_workflow should report progress through logging."""
+        mock_workflow.config.output_base_dir = str(temp_dir)
+
+        with caplog.at_level("INFO", logger="src.workflow.orchestrator"):
+            mock_workflow.run_complete_workflow("BOP Installation", sample_documents)
+
+        assert "Running Agent 1: Comparison Analyst..." in caplog.messages
+        assert "✓ agent5_standardisation completed" in caplog.messages
+        assert "Workflow completed successfully!" in caplog.messages
+
+    def test_run_complete_workflow_logs_wall_clock_duration(self, mock_workflow, temp_dir, sample_documents, caplog):
+        """The total duration logged should be wall-clock time, not summed agent time."""
+        mock_workflow.config.output_base_dir = str(temp_dir)
+
+        with caplog.at_level("INFO", logger="src.workflow.orchestrator"):
+            output_dir = mock_workflow.run_complete_workflow("BOP Installation", sample_documents)
+
+        summary = json.loads((output_dir / "summary.json").read_text())
+        # Mocked agents report 1s each but return instantly
+        assert summary["total_duration_seconds"] == 5.0
+        assert f"Total duration (wall clock): {summary['wall_duration_seconds']:.2f}s" in caplog.messages
+        assert "Agent time (sum over agents): 5.00s" in caplog.messages
+
     def test_run_complete_workflow_with_empty_documents(self, mock_workflow, temp_dir):
         """run_complete_workflow should handle empty documents dictionary."""
         mock_workflow.config.output_base_dir = str(temp_dir)
@@ -319,6 +445,145 @@ class TestADNOCWorkflowRunCompleteWorkflow:
         assert output_dir.parent.parent == temp_dir
 
 
+class TestADNOCWorkflowParallelism:
+    """Tests for concurrent agent execution."""
+
+    def _make_workflow(self, config, results):
+        """Build a workflow whose agents return ``results[agentN]``."""
+        patches = [
+            patch("src.workflow.orchestrator.ComparisonAgent"),
+            patch("src.workflow.orchestrator.GapDetectorAgent"),
+            patch("src.workflow.orchestrator.HPEvaluatorAgent"),
+            patch("src.workflow.orchestrator.EquipmentValidatorAgent"),
+            patch("src.workflow.orchestrator.StandardisationWriterAgent"),
+        ]
+        mocks = [p.start() for p in patches]
+        try:
+            for i, mock_agent in enumerate(mocks, 1):
+                mock_agent.return_value.run.return_value = results[f"agent{i}"]
+            return ADNOCWorkflow(config)
+        finally:
+            for p in patches:
+                p.stop()
+
+    @pytest.fixture
+    def results(self):
+        """Distinct results for each agent."""
+        return {
+            f"agent{i}": AgentResult(
+                content=f"Agent {i} output",
+                meta={"agent": f"Agent {i}", "total_duration_seconds": 1.0, "tokens_total": 10},
+            )
+            for i in range(1, 6)
+        }
+
+    def test_agent4_overlaps_agents_2_and_3(self, temp_dir, sample_documents, results):
+        """Agent 4 should already be running while Agent 2 runs."""
+        import threading
+
+        workflow = self._make_workflow(WorkflowConfig(output_base_dir=str(temp_dir)), results)
+        agent4_started = threading.Event()
+
+        def agent4_run(*args, **kwargs):
+            agent4_started.set()
+            return results["agent4"]
+
+        def agent2_run(*args, **kwargs):
+            assert agent4_started.wait(timeout=5), "Agent 4 did not start concurrently"
+            return results["agent2"]
+
+        workflow.agent4.run.side_effect = agent4_run
+        workflow.agent2.run.side_effect = agent2_run
+
+        output_dir = workflow.run_complete_workflow("Test", sample_documents)
+
+        # Agent 4 sees only Agent 1's output; summary stays in agent order
+        assert list(workflow.agent4.run.call_args[0][1]) == ["agent1"]
+        summary = json.loads((output_dir / "summary.json").read_text())
+        assert [a["name"] for a in summary["agents"]] == [
+            "agent1_comparison",
+            "agent2_gaps",
+            "agent3_hp_evaluation",
+            "agent4_equipment_validation",
+            "agent5_standardisation",
+        ]
+        assert "wall_duration_seconds" in summary
+
+    def test_sequential_mode(self, temp_dir, sample_documents, results):
+        """With parallel=False, Agent 4 should run after Agent 3."""
+        config = WorkflowConfig(output_base_dir=str(temp_dir), parallel=False)
+        workflow = self._make_workflow(config, results)
+        order = []
+        for i in range(1, 6):
+            agent = getattr(workflow, f"agent{i}")
+            agent.run.side_effect = (
+                lambda *a, _i=i, **k: order.append(_i) or results[f"agent{_i}"]
+            )
+
+        workflow.run_complete_workflow("Test", sample_documents)
+
+        assert order == [1, 2, 3, 4, 5]
+
+    def test_finished_outputs_written_before_failure(self, temp_dir, sample_documents, results):
+        """Agent 4's files should be written even if Agent 2 later fails."""
+        workflow = self._make_workflow(WorkflowConfig(output_base_dir=str(temp_dir)), results)
+
+        def agent2_run(*args, **kwargs):
+            deadline = time.time() + 5
+            while not list(temp_dir.rglob("agent4_equipment_validation.md")) and time.time() < deadline:
+                time.sleep(0.01)
+            raise RuntimeError("Agent 2 failed")
+
+        workflow.agent2.run.side_effect = agent2_run
+
+        with pytest.raises(RuntimeError, match="Agent 2 failed"):
+            workflow.run_complete_workflow("Test", sample_documents)
+
+        (md_path,) = temp_dir.rglob("agent4_equipment_validation.md")
+        assert md_path.read_text(encoding="utf-8") == "Agent 4 output"
+        assert not list(temp_dir.rglob("summary.json"))
+
+    def test_agents_receive_only_their_dependencies(self, temp_dir, sample_documents, results):
+        """Each agent should be passed exactly the outputs it depends on."""
+        workflow = self._make_workflow(WorkflowConfig(output_base_dir=str(temp_dir)), results)
+
+        workflow.run_complete_workflow("Test", sample_documents)
+
+        for key, deps in AGENT_DEPENDENCIES.items():
+            previous = getattr(workflow, key).run.call_args[0][1]
+            assert previous == {dep: results[dep].content for dep in deps}
+
+    def test_dependency_graph_follows_agent_order(self):
+        """Dependencies should only point at earlier steps."""
+        order = [key for key, _, _ in AGENT_STEPS]
+        assert sorted(AGENT_DEPENDENCIES) == sorted(order)
+        for key, deps in AGENT_DEPENDENCIES.items():
+            assert all(order.index(dep) < order.index(key) for dep in deps)
+
+
+class TestRunWorkflows:
+    """Tests for running several workflows concurrently."""
+
+    def test_run_workflows_uses_one_workflow_per_job(self, temp_dir):
+        """Each job should get its own workflow; results follow job order."""
+        config = WorkflowConfig(output_base_dir=str(temp_dir))
+        jobs = [("Op A", {"a": "text"}), ("Op B", {"b": "text"}), ("Op C", {"c": "text"})]
+
+        with patch("src.workflow.orchestrator.ADNOCWorkflow") as mock_workflow_cls:
+            mock_workflow_cls.return_value.run_complete_workflow.side_effect = (
+                lambda name, docs: temp_dir / name
+            )
+            output_dirs = run_workflows(config, jobs, max_concurrency=2)
+
+        assert output_dirs == [temp_dir / "Op A", temp_dir / "Op B", temp_dir / "Op C"]
+        assert mock_workflow_cls.call_count == 3
+        mock_workflow_cls.assert_called_with(config)
+
+    def test_run_workflows_empty(self):
+        """No jobs should return an empty list."""
+        assert run_workflows(WorkflowConfig(), []) == []
+
+
 class TestADNOCWorkflowEdgeCases:
     """Edge case tests for ADNOCWorkflow."""
 